@@ -844,9 +844,13 @@ def run_analysis():
         # Stream the analysis
         trace = []
         for chunk in graph.graph.stream(init_agent_state, **args):
+            # Analysts talk in their own message channels
+            new_messages = graph.propagator.get_new_messages(
+                trace[-1] if trace else None, chunk
+            )
             if len(chunk["messages"]) > 0:
                 # Get the last message from the chunk
-                last_message = chunk["messages"][-1]
+                last_message = (new_messages or chunk["messages"])[-1]
 
                 # Extract message content and type
                 if hasattr(last_message, "content"):
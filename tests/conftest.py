@@ -0,0 +1,11 @@
+import pytest
+
+from tradingagents.dataflows import config
+
+
+@pytest.fixture
+def data_cache_dir(tmp_path, monkeypatch):
+    """Run the test against the default config with a fresh data cache."""
+    monkeypatch.setattr(config, "_config", None)
+    config.set_config({"data_cache_dir": str(tmp_path)})
+    return tmp_path
@@ -0,0 +1,84 @@
+import json
+import os
+
+import pytest
+
+from tradingagents.dataflows.derived_files import open_or_build
+from tradingagents.dataflows.finnhub_store import FinnhubStore
+
+
+def write_source(path, data, mtime):
+    with open(path, "w") as f:
+        json.dump(data, f)
+    os.utime(path, (mtime, mtime))
+
+
+def test_rebuilds_only_when_source_changes(tmp_path):
+    source = tmp_path / "source.txt"
+    source.write_text("one")
+    builds = []
+
+    def build(source, base_path):
+        builds.append(base_path)
+        with open(source) as f, open(base_path + ".out", "w") as out:
+            out.write(f.read().upper())
+
+    def load(base_path):
+        with open(base_path + ".out") as f:
+            return f.read()
+
+    base_path = str(tmp_path / "derived" / "source")
+    assert open_or_build(str(source), base_path, (".out",), build, load) == "ONE"
+    assert open_or_build(str(source), base_path, (".out",), build, load) == "ONE"
+    assert len(builds) == 1
+    # built under a temporary name, then swapped in
+    assert builds[0] != base_path
+
+    source.write_text("two!")
+    assert open_or_build(str(source), base_path, (".out",), build, load) == "TWO!"
+    assert len(builds) == 2
+    assert sorted(os.listdir(tmp_path / "derived")) == ["source.json", "source.out"]
+
+
+def test_failed_build_leaves_previous_files(tmp_path):
+    source = tmp_path / "source.txt"
+    source.write_text("one")
+    base_path = str(tmp_path / "source")
+
+    def build(source, base_path):
+        with open(base_path + ".out", "w") as out:
+            out.write(open(source).read())
+
+    def failing_build(source, base_path):
+        with open(base_path + ".out", "w") as out:
+            out.write("partial")
+        raise ValueError("bad source")
+
+    def load(base_path):
+        return open(base_path + ".out").read()
+
+    open_or_build(str(source), base_path, (".out",), build, load)
+    source.write_text("broken")
+    with pytest.raises(ValueError):
+        open_or_build(str(source), base_path, (".out",), failing_build, load)
+
+    assert open(base_path + ".out").read() == "one"
+    assert sorted(os.listdir(tmp_path)) == ["source.json", "source.out", "source.txt"]
+
+
+def test_finnhub_rebuild_keeps_open_mappings(tmp_path):
+    source_dir = tmp_path / "data" / "insider_trans"
+    source_dir.mkdir(parents=True)
+    source = str(source_dir / "AAA_data_formatted.json")
+    write_source(source, {"2024-01-02": [{"v": 1}], "2024-01-03": [{"v": 2}]}, 1000)
+
+    old = FinnhubStore(str(tmp_path / "cache")).get_index(source)
+    write_source(source, {"2024-01-04": [{"v": 3}]}, 2000)
+    new = FinnhubStore(str(tmp_path / "cache")).get_index(source)
+
+    # the old index still reads the files it mapped
+    assert old.get_range("2024-01-01", "2024-01-31") == {
+        "2024-01-02": [{"v": 1}],
+        "2024-01-03": [{"v": 2}],
+    }
+    assert new.get_range("2024-01-01", "2024-01-31") == {"2024-01-04": [{"v": 3}]}
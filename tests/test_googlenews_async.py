@@ -0,0 +1,127 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from tradingagents.dataflows.googlenews_utils import (
+    TokenBucket,
+    get_token_bucket,
+    getNewsDataAsync,
+)
+
+RESULT = (
+    '<div class="SoaBEf"><a href="https://news.example.com/{q}/{page}/{i}">l</a>'
+    '<div class="MBeuO">{q} {page}-{i}</div><div class="GI74Re">snippet</div>'
+    '<div class="LfVVr">1 day ago</div><div class="NUnG9d"><span>Source</span></div></div>'
+)
+NEXT_LINK = '<a id="pnnext" href="#">Next</a>'
+BLOCKED_PAGE = "<html><body>Our systems have detected unusual traffic.</body></html>"
+
+
+class NewsStub:
+    """Local Google News stand-in: queries "pages-N" have N result pages."""
+
+    def __init__(self):
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                params = parse_qs(urlparse(self.path).query)
+                query, start = params["q"][0], int(params["start"][0])
+                stub.requests.append((query, start))
+                body = stub.page(query, start // 10).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=UTF-8")
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/search"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def page(self, query, page):
+        if query == "blocked":
+            return BLOCKED_PAGE
+        pages = int(query.split("-")[1])
+        body = ""
+        if page < pages:
+            body = "".join(RESULT.format(q=query, page=page, i=i) for i in range(10))
+            if page < pages - 1:
+                body += NEXT_LINK
+        return f"<html><body>{body}</body></html>"
+
+    def starts(self, query):
+        return sorted(start for q, start in self.requests if q == query)
+
+
+@pytest.fixture
+def news_stub():
+    stub = NewsStub()
+    yield stub
+    stub.server.shutdown()
+
+
+def scrape(stub, query):
+    return asyncio.run(
+        getNewsDataAsync(
+            query,
+            "2025-01-01",
+            "2025-01-10",
+            max_concurrency=3,
+            requests_per_second=1000,
+            search_url=stub.url,
+        )
+    )
+
+
+def test_single_page_costs_one_request(data_cache_dir, news_stub):
+    results = scrape(news_stub, "pages-1")
+    assert len(results) == 10
+    assert news_stub.starts("pages-1") == [0]
+
+
+def test_prefetch_stops_at_last_page(data_cache_dir, news_stub):
+    results = scrape(news_stub, "pages-4")
+    assert [r["title"] for r in results] == [
+        f"pages-4 {page}-{i}" for page in range(4) for i in range(10)
+    ]
+    # page 0 alone, then pages 1-3 together; the last one is start=30
+    assert news_stub.starts("pages-4") == [0, 10, 20, 30]
+
+
+def test_waste_is_bounded(data_cache_dir, news_stub):
+    results = scrape(news_stub, "pages-2")
+    assert len(results) == 20
+    assert news_stub.starts("pages-2") == [0, 10, 20, 30]
+
+
+def test_results_are_cached(data_cache_dir, news_stub):
+    first = scrape(news_stub, "pages-2")
+    second = scrape(news_stub, "pages-2")
+    assert first == second
+    assert len(news_stub.starts("pages-2")) == 4
+
+
+def test_blocked_pages_are_not_cached(data_cache_dir, news_stub):
+    assert scrape(news_stub, "blocked") == []
+    assert scrape(news_stub, "blocked") == []
+    assert news_stub.starts("blocked") == [0, 0]
+
+
+def test_token_bucket_is_shared():
+    assert get_token_bucket(2.0, 3) is get_token_bucket(2.0, 3)
+    assert get_token_bucket(2.0, 3) is not get_token_bucket(1.0, 3)
+
+
+def test_token_bucket_paces_after_burst():
+    bucket = TokenBucket(rate=10, capacity=2)
+    delays = [bucket.reserve() for _ in range(4)]
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.1, abs=0.01)
+    assert delays[3] == pytest.approx(0.2, abs=0.01)
@@ -0,0 +1,90 @@
+import os
+
+import pytest
+
+from tradingagents.dataflows.googlenews_utils import (
+    NEWS_PARSERS,
+    page_encoding,
+    parse_news_page,
+)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "google_news")
+
+# fixture page -> Content-Type header it was served with
+PAGES = {
+    "results_utf8.html": "text/html; charset=UTF-8",
+    "results_windows1252.html": "text/html",
+    "results_iso88591.html": "text/html",
+    "results_undeclared.html": "text/html",
+    "results_header_charset.html": "text/html; charset=windows-1252",
+    "last_page.html": "text/html; charset=UTF-8",
+    "unusual_traffic.html": "text/html; charset=UTF-8",
+}
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+        return f.read()
+
+
+def parse_with(parser, name):
+    content = read_fixture(name)
+    encoding = page_encoding(content, PAGES[name])
+    return NEWS_PARSERS[parser](content, encoding)
+
+
+@pytest.mark.parametrize("name", sorted(PAGES))
+def test_lxml_matches_bs4(name):
+    assert parse_with("lxml", name) == parse_with("bs4", name)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "results_windows1252.html",
+        "results_iso88591.html",
+        "results_header_charset.html",
+    ],
+)
+@pytest.mark.parametrize("parser", sorted(NEWS_PARSERS))
+def test_declared_charset_is_honoured(parser, name):
+    results, has_more = parse_with(parser, name)
+    assert has_more
+    assert results[0]["title"] == "Café – naïve € rally lifts & shares"
+    assert results[0]["snippet"] == "Investors’ “risk-on” mood: résumé of the day…"
+    assert results[-1]["title"] == "Nvidia surges after earnings"
+
+
+@pytest.mark.parametrize("name", ["results_utf8.html", "results_undeclared.html"])
+@pytest.mark.parametrize("parser", sorted(NEWS_PARSERS))
+def test_utf8_pages(parser, name):
+    results, has_more = parse_with(parser, name)
+    assert has_more
+    # the card without a snippet is skipped
+    assert len(results) == 5
+    assert results[-1]["title"] == "東京株式 – 日経平均が上昇"
+    assert results[-1]["source"] == "日本経済新聞"
+    assert results[0]["link"] == "https://news.example.com/0?ref=gn&id=0"
+
+
+@pytest.mark.parametrize("parser", sorted(NEWS_PARSERS))
+def test_last_and_blocked_pages(parser):
+    results, has_more = parse_with(parser, "last_page.html")
+    assert len(results) == 2 and not has_more
+    assert parse_with(parser, "unusual_traffic.html") == ([], False)
+
+
+def test_page_encoding():
+    content = read_fixture("results_windows1252.html")
+    assert page_encoding(content) == "windows-1252"
+    assert page_encoding(content, "text/html; charset=utf-8") == "utf-8"
+    assert page_encoding(read_fixture("results_iso88591.html")) == "windows-1252"
+    assert page_encoding(read_fixture("results_undeclared.html")) == "utf-8"
+    assert page_encoding(b"<html></html>", "text/html; charset=bogus") == "utf-8"
+    assert page_encoding("<html></html>", "text/html; charset=latin-1") == "utf-8"
+
+
+def test_parse_news_page_uses_content_type():
+    content = read_fixture("results_header_charset.html")
+    results, _ = parse_news_page(content, "text/html; charset=windows-1252")
+    assert results[0]["title"] == "Café – naïve € rally lifts & shares"
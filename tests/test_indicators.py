@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows.indicator_engine import (
+    INDICATOR_BACKENDS,
+    SUPPORTED_INDICATORS,
+    WARMUP_BARS,
+    IndicatorEngine,
+    compute_stockstats_indicators,
+)
+from tradingagents.dataflows.indicator_kernels import compute_numpy_indicators
+
+
+@pytest.fixture(scope="module")
+def prices():
+    """Ten years of a synthetic daily random walk."""
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range("2015-01-01", "2024-12-31")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, len(dates))))
+    spread = close * rng.uniform(0.002, 0.03, len(dates))
+    return pd.DataFrame(
+        {
+            "Date": dates.strftime("%Y-%m-%d"),
+            "Open": close + rng.normal(0, 0.5, len(dates)),
+            "High": close + spread,
+            "Low": close - spread,
+            "Close": close,
+            "Volume": rng.integers(100_000, 10_000_000, len(dates)).astype(float),
+        }
+    )
+
+
+def test_numpy_kernels_match_stockstats(prices):
+    expected = compute_stockstats_indicators(prices.copy())
+    actual = compute_numpy_indicators(prices)
+    assert actual.shape == expected.shape == (len(prices), len(SUPPORTED_INDICATORS))
+    for j, indicator in enumerate(SUPPORTED_INDICATORS):
+        np.testing.assert_allclose(
+            actual[:, j],
+            expected[:, j],
+            rtol=1e-9,
+            atol=1e-8,
+            equal_nan=True,
+            err_msg=indicator,
+        )
+
+
+@pytest.mark.parametrize("backend", sorted(INDICATOR_BACKENDS))
+def test_incremental_update_matches_full_recompute(tmp_path, prices, backend):
+    engine = IndicatorEngine(str(tmp_path), backend)
+    engine.get_matrix("AAA", "online", "v1", lambda: prices.iloc[:-60].copy())
+
+    # a new process picks the stored matrix up and appends the new bars
+    engine = IndicatorEngine(str(tmp_path), backend)
+    computed_rows = []
+    compute = engine.compute
+    engine.compute = lambda data: computed_rows.append(len(data)) or compute(data)
+    updated = engine.get_matrix("AAA", "online", "v2", lambda: prices.copy())
+    assert computed_rows == [WARMUP_BARS + 60]
+
+    full = IndicatorEngine(None, backend).get_matrix(
+        "AAA", "online", "v2", lambda: prices.copy()
+    )
+
+    np.testing.assert_array_equal(updated.dates, full.dates)
+    np.testing.assert_allclose(
+        updated.values, full.values, rtol=1e-9, atol=1e-8, equal_nan=True
+    )
+    assert updated.last_close == full.last_close
+
+
+@pytest.mark.parametrize("backend", sorted(INDICATOR_BACKENDS))
+def test_shifted_window_keeps_trailing_rows(tmp_path, prices, backend):
+    engine = IndicatorEngine(str(tmp_path), backend)
+    first = engine.get_matrix("AAA", "online", "v1", lambda: prices.iloc[:-20].copy())
+    shifted = engine.get_matrix(
+        "AAA", "online", "v2", lambda: prices.iloc[20:].reset_index(drop=True)
+    )
+
+    # rows dropped from the front, new ones computed with a warm-up
+    np.testing.assert_array_equal(shifted.dates, prices["Date"].to_numpy()[20:])
+    np.testing.assert_array_equal(shifted.values[:-20], first.values[20:])
+    full = IndicatorEngine(None, backend).get_matrix(
+        "AAA", "online", "v1", lambda: prices.copy()
+    )
+    np.testing.assert_allclose(
+        shifted.values[-20:], full.values[-20:], rtol=1e-9, atol=1e-8, equal_nan=True
+    )
@@ -0,0 +1,111 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tradingagents.dataflows.price_cache import (
+    read_price_cache,
+    set_price_fetcher,
+    update_price_cache,
+)
+
+FORMATS = ["csv", "feather", "parquet"]
+
+
+class FakeYahoo:
+    """Serves a fixed daily history in [start, end) and records every call."""
+
+    def __init__(self, adjustment=1.0):
+        dates = pd.bdate_range("2020-01-01", "2024-12-31")
+        closes = 100 + np.cumsum(np.sin(np.arange(len(dates))))
+        self.history = pd.DataFrame(
+            {
+                "Date": dates,
+                "Open": closes,
+                "High": closes + 1,
+                "Low": closes - 1,
+                "Close": closes,
+                "Volume": np.full(len(dates), 1000.0),
+            }
+        )
+        self.adjustment = adjustment
+        self.calls = []
+
+    def __call__(self, symbol, start_date, end_date):
+        self.calls.append((start_date, end_date))
+        rows = (self.history["Date"] >= start_date) & (self.history["Date"] < end_date)
+        data = self.history.loc[rows].reset_index(drop=True)
+        for column in ("Open", "High", "Low", "Close"):
+            data[column] = data[column] * self.adjustment
+        return data
+
+
+@pytest.fixture
+def fake_yahoo():
+    fetcher = FakeYahoo()
+    set_price_fetcher(fetcher)
+    yield fetcher
+    set_price_fetcher(None)
+
+
+def expected(fetcher, start_date, end_date):
+    saved, fetcher.calls = fetcher.calls, []
+    data = fetcher("AAA", start_date, end_date)
+    fetcher.calls = saved
+    return data
+
+
+def leftover_tmp_files(cache_dir):
+    return [name for name in os.listdir(cache_dir) if name.endswith(".tmp")]
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_first_fill(tmp_path, fake_yahoo, fmt):
+    data = update_price_cache("AAA", str(tmp_path), "2021-01-01", "2022-01-01", fmt)
+    assert fake_yahoo.calls == [("2021-01-01", "2022-01-01")]
+    pd.testing.assert_frame_equal(
+        data, expected(fake_yahoo, "2021-01-01", "2022-01-01"), check_dtype=False
+    )
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        [f"AAA-YFin-data.{fmt}", "AAA-YFin-data.json"]
+    )
+
+    # a covered range is served from the cache
+    update_price_cache("AAA", str(tmp_path), "2021-03-01", "2021-06-01", fmt)
+    assert len(fake_yahoo.calls) == 1
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_tail_append(tmp_path, fake_yahoo, fmt):
+    update_price_cache("AAA", str(tmp_path), "2021-01-01", "2022-01-01", fmt)
+    data = update_price_cache("AAA", str(tmp_path), "2021-01-01", "2022-03-01", fmt)
+
+    # only the tail is fetched, starting a few days before the cached end
+    assert fake_yahoo.calls[1] == ("2021-12-22", "2022-03-01")
+    assert len(fake_yahoo.calls) == 2
+    pd.testing.assert_frame_equal(
+        data, expected(fake_yahoo, "2021-01-01", "2022-03-01"), check_dtype=False
+    )
+    assert not data["Date"].duplicated().any()
+    assert leftover_tmp_files(tmp_path) == []
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_restated_history_is_refetched(tmp_path, fake_yahoo, fmt):
+    update_price_cache("AAA", str(tmp_path), "2021-01-01", "2022-01-01", fmt)
+
+    # a split re-adjusts every past close
+    fake_yahoo.adjustment = 0.5
+    data = update_price_cache("AAA", str(tmp_path), "2021-01-01", "2022-03-01", fmt)
+
+    assert fake_yahoo.calls[1:] == [
+        ("2021-12-22", "2022-03-01"),
+        ("2021-01-01", "2022-03-01"),
+    ]
+    fresh = expected(fake_yahoo, "2021-01-01", "2022-03-01")
+    pd.testing.assert_frame_equal(data, fresh, check_dtype=False)
+
+    cached = read_price_cache(str(tmp_path / f"AAA-YFin-data.{fmt}"), fmt)
+    np.testing.assert_allclose(cached["Close"], fresh["Close"])
+    assert leftover_tmp_files(tmp_path) == []
@@ -1,11 +1,12 @@
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.runnables import RunnableLambda
 import time
 import json
 
 
 def create_market_analyst(llm, toolkit):
 
-    def market_analyst_node(state):
+    def market_analyst_chain(state):
         current_date = state["trade_date"]
         ticker = state["company_of_interest"]
         company_name = state["company_of_interest"]
@@ -72,18 +73,25 @@ Volume-Based Indicators:
         prompt = prompt.partial(current_date=current_date)
         prompt = prompt.partial(ticker=ticker)
 
-        chain = prompt | llm.bind_tools(tools)
-
-        result = chain.invoke(state["messages"])
+        return prompt | llm.bind_tools(tools)
 
+    def market_analyst_update(result):
         report = ""
 
         if len(result.tool_calls) == 0:
             report = result.content
        
         return {
-            "messages": [result],
+            "market_messages": [result],
             "market_report": report,
         }
 
-    return market_analyst_node
+    def market_analyst_node(state):
+        result = market_analyst_chain(state).invoke(state["market_messages"])
+        return market_analyst_update(result)
+
+    async def amarket_analyst_node(state):
+        result = await market_analyst_chain(state).ainvoke(state["market_messages"])
+        return market_analyst_update(result)
+
+    return RunnableLambda(market_analyst_node, afunc=amarket_analyst_node)
@@ -1,10 +1,11 @@
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.runnables import RunnableLambda
 import time
 import json
 
 
 def create_social_media_analyst(llm, toolkit):
-    def social_media_analyst_node(state):
+    def social_media_analyst_chain(state):
         current_date = state["trade_date"]
         ticker = state["company_of_interest"]
         company_name = state["company_of_interest"]
@@ -43,18 +44,25 @@ def create_social_media_analyst(llm, toolkit):
         prompt = prompt.partial(current_date=current_date)
         prompt = prompt.partial(ticker=ticker)
 
-        chain = prompt | llm.bind_tools(tools)
-
-        result = chain.invoke(state["messages"])
+        return prompt | llm.bind_tools(tools)
 
+    def social_media_analyst_update(result):
         report = ""
 
         if len(result.tool_calls) == 0:
             report = result.content
 
         return {
-            "messages": [result],
+            "social_messages": [result],
             "sentiment_report": report,
         }
 
-    return social_media_analyst_node
+    def social_media_analyst_node(state):
+        result = social_media_analyst_chain(state).invoke(state["social_messages"])
+        return social_media_analyst_update(result)
+
+    async def asocial_media_analyst_node(state):
+        result = await social_media_analyst_chain(state).ainvoke(state["social_messages"])
+        return social_media_analyst_update(result)
+
+    return RunnableLambda(social_media_analyst_node, afunc=asocial_media_analyst_node)
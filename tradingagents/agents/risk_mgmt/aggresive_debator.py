@@ -1,12 +1,13 @@
 import time
 import json
 
+from langchain_core.runnables import RunnableLambda
+
 
 def create_risky_debator(llm):
-    def risky_node(state) -> dict:
+    def risky_prompt(state) -> str:
         risk_debate_state = state["risk_debate_state"]
         history = risk_debate_state.get("history", "")
-        risky_history = risk_debate_state.get("risky_history", "")
 
         current_safe_response = risk_debate_state.get("current_safe_response", "")
         current_neutral_response = risk_debate_state.get("current_neutral_response", "")
@@ -32,7 +33,12 @@ Here is the current conversation history: {history} Here are the last arguments
 
 Engage actively by addressing any specific concerns raised, refuting the weaknesses in their logic, and asserting the benefits of risk-taking to outpace market norms. Maintain a focus on debating and persuading, not just presenting data. Challenge each counterpoint to underscore why a high-risk approach is optimal. Output conversationally as if you are speaking without any special formatting."""
 
-        response = llm.invoke(prompt)
+        return prompt
+
+    def risky_update(state, response) -> dict:
+        risk_debate_state = state["risk_debate_state"]
+        history = risk_debate_state.get("history", "")
+        risky_history = risk_debate_state.get("risky_history", "")
 
         argument = f"Risky Analyst: {response.content}"
 
@@ -52,4 +58,10 @@ Engage actively by addressing any specific concerns raised, refuting the weaknes
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return risky_node
+    def risky_node(state) -> dict:
+        return risky_update(state, llm.invoke(risky_prompt(state)))
+
+    async def arisky_node(state) -> dict:
+        return risky_update(state, await llm.ainvoke(risky_prompt(state)))
+
+    return RunnableLambda(risky_node, afunc=arisky_node)
@@ -2,18 +2,16 @@ import functools
 import time
 import json
 
+from langchain_core.runnables import RunnableLambda
+
 
 def create_trader(llm, memory):
-    def trader_node(state, name):
+    def trader_situation(state) -> str:
+        return f"{state['market_report']}\n\n{state['sentiment_report']}\n\n{state['news_report']}\n\n{state['fundamentals_report']}"
+
+    def trader_messages(state, past_memories) -> list:
         company_name = state["company_of_interest"]
         investment_plan = state["investment_plan"]
-        market_research_report = state["market_report"]
-        sentiment_report = state["sentiment_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["fundamentals_report"]
-
-        curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
 
         past_memory_str = ""
         for i, rec in enumerate(past_memories, 1):
@@ -32,12 +30,28 @@ def create_trader(llm, memory):
             context,
         ]
 
-        result = llm.invoke(messages)
+        return messages
 
+    def trader_update(result, name) -> dict:
         return {
             "messages": [result],
             "trader_investment_plan": result.content,
             "sender": name,
         }
 
-    return functools.partial(trader_node, name="Trader")
+    def trader_node(state, name):
+        past_memories = memory.get_memories(trader_situation(state), n_matches=2)
+        result = llm.invoke(trader_messages(state, past_memories))
+        return trader_update(result, name)
+
+    async def atrader_node(state, name):
+        past_memories = await memory.aget_memories(
+            trader_situation(state), n_matches=2
+        )
+        result = await llm.ainvoke(trader_messages(state, past_memories))
+        return trader_update(result, name)
+
+    return RunnableLambda(
+        functools.partial(trader_node, name="Trader"),
+        afunc=functools.partial(atrader_node, name="Trader"),
+    )
@@ -5,6 +5,16 @@ from langchain_openai import ChatOpenAI
 from tradingagents.agents import *
 from langgraph.prebuilt import ToolNode
 from langgraph.graph import END, StateGraph, START, MessagesState
+from langgraph.graph.message import add_messages
+from langchain_core.messages import AnyMessage
+
+# state key of each analyst's own tool-call conversation
+ANALYST_MESSAGE_CHANNELS = {
+    "market": "market_messages",
+    "social": "social_messages",
+    "news": "news_messages",
+    "fundamentals": "fundamentals_messages",
+}
 
 
 # Researcher team state
@@ -54,6 +64,13 @@ class AgentState(MessagesState):
     sender: Annotated[str, "Agent that sent this message"]
 
     # research step
+    # each analyst keeps its tool calls in its own channel, so analysts never
+    # see or clear each other's history and can run concurrently
+    market_messages: Annotated[Sequence[AnyMessage], add_messages]
+    social_messages: Annotated[Sequence[AnyMessage], add_messages]
+    news_messages: Annotated[Sequence[AnyMessage], add_messages]
+    fundamentals_messages: Annotated[Sequence[AnyMessage], add_messages]
+
     market_report: Annotated[str, "Report from the Market Analyst"]
     sentiment_report: Annotated[str, "Report from the Social Media Analyst"]
     news_report: Annotated[
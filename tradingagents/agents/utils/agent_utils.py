@@ -15,20 +15,18 @@ from tradingagents.default_config import DEFAULT_CONFIG
 from langchain_core.messages import HumanMessage
 
 
-def create_msg_delete():
-    def delete_messages(state):
-        """Clear messages and add placeholder for Anthropic compatibility"""
-        messages = state["messages"]
-        
-        # Remove all messages
-        removal_operations = [RemoveMessage(id=m.id) for m in messages]
-        
-        # Add a minimal placeholder message
-        placeholder = HumanMessage(content="Continue")
-        
-        return {"messages": removal_operations + [placeholder]}
-    
-    return delete_messages
+# days of news the get_google_news tool covers, in both its sync and async form
+GOOGLE_NEWS_LOOK_BACK_DAYS = 7
+
+
+def with_coroutine(coroutine):
+    """Give a tool an async implementation, used when the graph runs async."""
+
+    def attach(async_tool):
+        async_tool.coroutine = coroutine
+        return async_tool
+
+    return attach
 
 
 class Toolkit:
@@ -342,6 +340,11 @@ class Toolkit:
         return data_income_stmt
 
     @staticmethod
+    @with_coroutine(
+        functools.partial(
+            interface.aget_google_news, look_back_days=GOOGLE_NEWS_LOOK_BACK_DAYS
+        )
+    )
     @tool
     def get_google_news(
         query: Annotated[str, "Query to search with"],
@@ -357,11 +360,14 @@ class Toolkit:
             str: A formatted string containing the latest news from Google News based on the query and date range.
         """
 
-        google_news_results = interface.get_google_news(query, curr_date, 7)
+        google_news_results = interface.get_google_news(
+            query, curr_date, GOOGLE_NEWS_LOOK_BACK_DAYS
+        )
 
         return google_news_results
 
     @staticmethod
+    @with_coroutine(interface.aget_stock_news_openai)
     @tool
     def get_stock_news_openai(
         ticker: Annotated[str, "the company's ticker"],
@@ -381,6 +387,7 @@ class Toolkit:
         return openai_news_results
 
     @staticmethod
+    @with_coroutine(interface.aget_global_news_openai)
     @tool
     def get_global_news_openai(
         curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
@@ -398,6 +405,7 @@ class Toolkit:
         return openai_news_results
 
     @staticmethod
+    @with_coroutine(interface.aget_fundamentals_openai)
     @tool
     def get_fundamentals_openai(
         ticker: Annotated[str, "the company's ticker"],
@@ -1,6 +1,9 @@
 import chromadb
 from chromadb.config import Settings
-from openai import OpenAI
+from tradingagents.dataflows.openai_clients import (
+    get_async_openai_client,
+    get_openai_client,
+)
 
 
 class FinancialSituationMemory:
@@ -9,7 +12,8 @@ class FinancialSituationMemory:
             self.embedding = "nomic-embed-text"
         else:
             self.embedding = "text-embedding-3-small"
-        self.client = OpenAI(base_url=config["backend_url"])
+        self.backend_url = config["backend_url"]
+        self.client = get_openai_client(self.backend_url)
         self.chroma_client = chromadb.Client(Settings(allow_reset=True))
         self.situation_collection = self.chroma_client.create_collection(name=name)
 
@@ -21,6 +25,12 @@ class FinancialSituationMemory:
         )
         return response.data[0].embedding
 
+    async def aget_embedding(self, text):
+        """Get OpenAI embedding for a text without blocking the event loop"""
+        client = get_async_openai_client(self.backend_url)
+        response = await client.embeddings.create(model=self.embedding, input=text)
+        return response.data[0].embedding
+
     def add_situations(self, situations_and_advice):
         """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
 
@@ -47,7 +57,14 @@ class FinancialSituationMemory:
     def get_memories(self, current_situation, n_matches=1):
         """Find matching recommendations using OpenAI embeddings"""
         query_embedding = self.get_embedding(current_situation)
+        return self._query_memories(query_embedding, n_matches)
+
+    async def aget_memories(self, current_situation, n_matches=1):
+        """Async version of get_memories; the embedding request is awaited"""
+        query_embedding = await self.aget_embedding(current_situation)
+        return self._query_memories(query_embedding, n_matches)
 
+    def _query_memories(self, query_embedding, n_matches):
         results = self.situation_collection.query(
             query_embeddings=[query_embedding],
             n_results=n_matches,
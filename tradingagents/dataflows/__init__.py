@@ -1,8 +1,19 @@
 from .finnhub_utils import get_data_in_range
-from .googlenews_utils import getNewsData
+from .googlenews_utils import getNewsData, getNewsDataAsync
 from .yfin_utils import YFinanceUtils
 from .reddit_utils import fetch_top_from_category
 from .stockstats_utils import StockstatsUtils
+from .price_store import PriceStore, get_price_store
+from .trading_calendar import TradingCalendar
+from .simfin_store import SimFinStore, get_simfin_store
+from .finnhub_store import FinnhubStore, get_finnhub_store
+from .reddit_store import RedditStore, get_reddit_store
+from .response_cache import ResponseCache, get_response_cache
+from .openai_clients import (
+    aclose_async_openai_clients,
+    get_async_openai_client,
+    get_openai_client,
+)
 from .yfin_utils import YFinanceUtils
 
 from .interface import (
@@ -17,8 +28,10 @@ from .interface import (
     get_simfin_balance_sheet,
     get_simfin_cashflow,
     get_simfin_income_statements,
+    get_simfin_statements_as_of,
     # Technical analysis functions
     get_stock_stats_indicators_window,
+    get_stock_stats_indicators_window_batch,
     get_stockstats_indicator,
     # Market data functions
     get_YFin_data_window,
@@ -37,8 +50,10 @@ __all__ = [
     "get_simfin_balance_sheet",
     "get_simfin_cashflow",
     "get_simfin_income_statements",
+    "get_simfin_statements_as_of",
     # Technical analysis functions
     "get_stock_stats_indicators_window",
+    "get_stock_stats_indicators_window_batch",
     "get_stockstats_indicator",
     # Market data functions
     "get_YFin_data_window",
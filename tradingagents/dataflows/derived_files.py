@@ -0,0 +1,65 @@
+import json
+import os
+import threading
+from typing import Annotated, Callable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def source_meta(source: Annotated[str, "path of the source file"]) -> dict:
+    """Path, size and modification time of source, as recorded in a sidecar json."""
+    stat = os.stat(source)
+    return {"source": source, "size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def _is_current(meta_file: str, meta: dict, paths: Sequence[str]) -> bool:
+    if not all(os.path.exists(path) for path in (meta_file, *paths)):
+        return False
+    try:
+        with open(meta_file, "r") as f:
+            return json.load(f) == meta
+    except (OSError, ValueError):
+        return False
+
+
+def open_or_build(
+    source: Annotated[str, "path of the source file"],
+    base_path: Annotated[str, "derived file path without extension"],
+    suffixes: Annotated[Sequence[str], "extensions of the files build writes"],
+    build: Annotated[
+        Callable[[str, str], None], "writes the derived files of source under a base path"
+    ],
+    load: Annotated[Callable[[str], T], "opens the derived files under a base path"],
+) -> T:
+    """
+    Open the files derived from source, rebuilding them if source changed.
+
+    A sidecar json (base_path + ".json") records the path, size and
+    modification time of the source the files were built from. On a
+    mismatch, build writes a fresh set under a temporary base path, the
+    files are swapped in with os.replace and the sidecar is written last.
+    Readers therefore never see a partial file, and processes still
+    mapping the old files keep reading them.
+    """
+    meta = source_meta(source)
+    meta_file = base_path + ".json"
+    paths = [base_path + suffix for suffix in suffixes]
+    if _is_current(meta_file, meta, paths):
+        return load(base_path)
+
+    os.makedirs(os.path.dirname(base_path), exist_ok=True)
+    tmp_base = f"{base_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        build(source, tmp_base)
+        for suffix, path in zip(suffixes, paths):
+            os.replace(tmp_base + suffix, path)
+    finally:
+        for suffix in suffixes:
+            if os.path.exists(tmp_base + suffix):
+                os.remove(tmp_base + suffix)
+
+    tmp_meta_file = tmp_base + ".json"
+    with open(tmp_meta_file, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp_meta_file, meta_file)
+    return load(base_path)
@@ -0,0 +1,204 @@
+import json
+import mmap
+import os
+import re
+import threading
+from typing import Annotated, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from .config import get_config
+from .derived_files import open_or_build
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+# everything up to the next bracket, treating strings as opaque
+_UNTIL_BRACKET = re.compile(
+    rb'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*', re.S
+)
+_SCALAR = re.compile(rb"[^,}\] \t\n\r]+")
+_EMPTY = re.compile(rb'(?:\[[ \t\n\r]*\]|\{[ \t\n\r]*\}|"")')
+
+
+def _skip_value(buf, pos: int) -> int:
+    """End offset of the json value starting at pos, found without decoding it."""
+    if buf[pos : pos + 1] == b'"':
+        return _STRING.match(buf, pos).end()
+    if buf[pos : pos + 1] not in (b"[", b"{"):
+        return _SCALAR.match(buf, pos).end()
+
+    depth = 0
+    while True:
+        pos = _UNTIL_BRACKET.match(buf, pos).end()
+        bracket = buf[pos : pos + 1]
+        if bracket in (b"", b'"'):
+            raise ValueError("Unterminated json value")
+        pos += 1
+        depth += 1 if bracket in (b"[", b"{") else -1
+        if depth == 0:
+            return pos
+
+
+def iter_json_object_spans(buf) -> Iterator[Tuple[str, int, int]]:
+    """
+    Stream the members of a top-level json object held in buf (bytes or an
+    mmap) as (key, start, end) byte spans of their values. Only the keys are
+    decoded, so skipped values never become Python objects.
+    """
+    pos = _WHITESPACE.match(buf, 0).end()
+    if buf[pos : pos + 1] != b"{":
+        raise ValueError("Expected a json object")
+    pos += 1
+
+    while True:
+        pos = _WHITESPACE.match(buf, pos).end()
+        if buf[pos : pos + 1] == b",":
+            pos = _WHITESPACE.match(buf, pos + 1).end()
+        if buf[pos : pos + 1] == b"}":
+            return
+
+        key = _STRING.match(buf, pos)
+        if key is None:
+            raise ValueError(f"Expected a json key at offset {pos}")
+        pos = _WHITESPACE.match(buf, key.end()).end()
+        if buf[pos : pos + 1] != b":":
+            raise ValueError(f"Expected ':' at offset {pos}")
+        start = _WHITESPACE.match(buf, pos + 1).end()
+        pos = _skip_value(buf, start)
+        yield json.loads(key.group()), start, pos
+
+
+class FinnhubIndex:
+    """
+    Date-sorted index over one Finnhub ``*_data_formatted.json`` file.
+
+    The file is split once into a blob of the raw per-date json values and a
+    structured array of (date, position in the file, byte range), sorted by
+    date. Both are memory-mapped, so a range query bisects the dates and
+    only decodes the values inside the range.
+    """
+
+    def __init__(self, index: np.ndarray, blob: np.ndarray):
+        self.index = index
+        self.blob = blob
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def get_range(
+        self,
+        start_date: Annotated[str, "first key, YYYY-MM-DD"],
+        end_date: Annotated[str, "last key, YYYY-MM-DD"],
+    ) -> Dict[str, list]:
+        """Non-empty values whose key lies in [start_date, end_date], in file order."""
+        dates = self.index["date"]
+        lo = np.searchsorted(dates, start_date, "left")
+        hi = np.searchsorted(dates, end_date, "right")
+        rows = self.index[lo:hi]
+        rows = rows[np.argsort(rows["pos"], kind="stable")]
+        return {
+            str(row["date"]): json.loads(
+                self.blob[row["start"] : row["end"]].tobytes().decode("utf-8")
+            )
+            for row in rows
+        }
+
+    @staticmethod
+    def build(
+        source: Annotated[str, "path of the Finnhub json file"],
+        base_path: Annotated[str, "index file path without extension"],
+    ) -> None:
+        """
+        Write the .idx.npy and .bin files of source. The file is streamed
+        through a memory map and values are copied as raw bytes, so indexing
+        a large news file never materializes it as Python objects.
+        """
+        entries, offset = [], 0
+        with open(source, "rb") as f, open(base_path + ".bin", "wb") as out:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError(f"Empty Finnhub data file: {source}")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                for pos, (key, start, end) in enumerate(iter_json_object_spans(buf)):
+                    # empty days are never returned, so they are not indexed
+                    if _EMPTY.fullmatch(buf, start, end):
+                        continue
+                    out.write(buf[start:end])
+                    entries.append((key, pos, offset, offset + end - start))
+                    offset += end - start
+
+        width = max((len(entry[0]) for entry in entries), default=1)
+        index = np.array(
+            entries,
+            dtype=[("date", f"U{width}"), ("pos", "i8"), ("start", "i8"), ("end", "i8")],
+        )
+        index = index[np.argsort(index["date"], kind="stable")]
+        np.save(base_path + ".idx.npy", index)
+
+    @classmethod
+    def open(
+        cls, base_path: Annotated[str, "index file path without extension"]
+    ) -> "FinnhubIndex":
+        index = np.load(base_path + ".idx.npy", mmap_mode="r")
+        if os.path.getsize(base_path + ".bin") == 0:
+            blob = np.empty(0, dtype=np.uint8)
+        else:
+            blob = np.memmap(base_path + ".bin", dtype=np.uint8, mode="r")
+        return cls(index, blob)
+
+
+class FinnhubStore:
+    """
+    Opens the index of each Finnhub file once per process, building it on
+    first use and again whenever the file is edited.
+    """
+
+    def __init__(self, cache_dir: Annotated[str, "where the indexes are kept"]):
+        self.cache_dir = cache_dir
+        self._indexes: Dict[str, FinnhubIndex] = {}
+        self._lock = threading.Lock()
+
+    def _open(self, source: str) -> FinnhubIndex:
+        data_type = os.path.basename(os.path.dirname(source))
+        name = os.path.splitext(os.path.basename(source))[0]
+        base_path = os.path.join(self.cache_dir, "finnhub", data_type, name)
+        return open_or_build(
+            source,
+            base_path,
+            (".idx.npy", ".bin"),
+            FinnhubIndex.build,
+            FinnhubIndex.open,
+        )
+
+    def get_index(
+        self, source: Annotated[str, "path of the Finnhub json file"]
+    ) -> FinnhubIndex:
+        # held while indexing so a file is only split once
+        with self._lock:
+            index = self._indexes.get(source)
+            if index is None:
+                index = self._indexes[source] = self._open(source)
+        return index
+
+    def get_range(
+        self,
+        source: Annotated[str, "path of the Finnhub json file"],
+        start_date: Annotated[str, "first key, YYYY-MM-DD"],
+        end_date: Annotated[str, "last key, YYYY-MM-DD"],
+    ) -> Dict[str, list]:
+        return self.get_index(source).get_range(start_date, end_date)
+
+
+_finnhub_stores: Dict[str, FinnhubStore] = {}
+_finnhub_stores_lock = threading.Lock()
+
+
+def get_finnhub_store(
+    cache_dir: Annotated[Optional[str], "defaults to the configured data cache"] = None,
+) -> FinnhubStore:
+    """Get the process-wide Finnhub store for cache_dir."""
+    cache_dir = cache_dir or get_config()["data_cache_dir"]
+    with _finnhub_stores_lock:
+        store = _finnhub_stores.get(cache_dir)
+        if store is None:
+            store = _finnhub_stores[cache_dir] = FinnhubStore(cache_dir)
+    return store
@@ -1,6 +1,7 @@
-import json
 import os
 
+from .finnhub_store import get_finnhub_store
+
 
 def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None):
     """
@@ -25,12 +26,5 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
             data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
         )
 
-    data = open(data_path, "r")
-    data = json.load(data)
-
-    # filter keys (date, str in format YYYY-MM-DD) by the date range (str, str in format YYYY-MM-DD)
-    filtered_data = {}
-    for key, value in data.items():
-        if start_date <= key <= end_date and len(value) > 0:
-            filtered_data[key] = value
-    return filtered_data
+    # the store indexes each file once and bisects the keys (str in format YYYY-MM-DD) for the date range
+    return get_finnhub_store().get_range(data_path, start_date, end_date)
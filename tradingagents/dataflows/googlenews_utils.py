@@ -1,6 +1,14 @@
+import asyncio
+import codecs
 import json
+import re
+import threading
+import aiohttp
 import requests
 from bs4 import BeautifulSoup
+import lxml.html
+from cssselect import HTMLTranslator
+from lxml import etree
 from datetime import datetime
 import time
 import random
@@ -12,6 +20,9 @@ from tenacity import (
     retry_if_result,
 )
 
+from .config import get_config
+from .news_cache import read_news_cache, write_news_cache
+
 
 def is_rate_limited(response):
     """Check if the response indicates rate limiting (status code 429)"""
@@ -31,12 +42,174 @@ def make_request(url, headers):
     return response
 
 
-def getNewsData(query, start_date, end_date):
+CONTENT_TYPE_CHARSET = re.compile(r"""charset\s*=\s*["']?([\w.:-]+)""", re.IGNORECASE)
+META_CHARSET = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?([\w.:-]+)""", re.IGNORECASE)
+# how far into the page to look for a <meta> charset
+META_CHARSET_SCAN_BYTES = 4096
+
+
+def page_encoding(content, content_type=None):
     """
-    Scrape Google News search results for a given query and date range.
-    query: str - search query
-    start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
-    end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+    Encoding of a result page: the charset of its Content-Type header, else
+    the charset declared in a <meta> tag, else UTF-8. Pages labelled
+    ISO-8859-1 or ASCII are decoded as windows-1252, as browsers do.
+    """
+    if isinstance(content, str):
+        return "utf-8"
+
+    match = CONTENT_TYPE_CHARSET.search(content_type or "")
+    if match is None:
+        match = META_CHARSET.search(content, 0, META_CHARSET_SCAN_BYTES)
+    if match is None:
+        return "utf-8"
+
+    label = match.group(1)
+    if isinstance(label, bytes):
+        label = label.decode("ascii")
+    try:
+        codec = codecs.lookup(label).name
+    except LookupError:
+        return "utf-8"
+    if codec in ("iso8859-1", "ascii"):
+        return "windows-1252"
+    return label.lower()
+
+
+def parse_news_page_bs4(content, encoding="utf-8"):
+    """
+    Parse one Google News result page with BeautifulSoup.
+    Returns the results on the page and whether to go on to the next page.
+    """
+    if isinstance(content, str):
+        soup = BeautifulSoup(content, "html.parser")
+    else:
+        soup = BeautifulSoup(content, "html.parser", from_encoding=encoding)
+    results_on_page = soup.select("div.SoaBEf")
+
+    news_results = []
+    for el in results_on_page:
+        try:
+            link = el.find("a")["href"]
+            title = el.select_one("div.MBeuO").get_text()
+            snippet = el.select_one(".GI74Re").get_text()
+            date = el.select_one(".LfVVr").get_text()
+            source = el.select_one(".NUnG9d span").get_text()
+            news_results.append(
+                {
+                    "link": link,
+                    "title": title,
+                    "snippet": snippet,
+                    "date": date,
+                    "source": source,
+                }
+            )
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
+
+    # No more results found, or no "Next" link (pagination)
+    has_more = bool(results_on_page) and soup.find("a", id="pnnext") is not None
+    return news_results, has_more
+
+
+class LxmlNewsExtractor:
+    """
+    Google News result extraction on lxml, the parser underneath parsel.
+    The CSS selectors of parse_news_page_bs4 are compiled to XPath once and
+    each page is parsed in a single pass, with the same results. Pages are
+    decoded with the encoding they are passed, one parser per encoding.
+    """
+
+    def __init__(self):
+        translator = HTMLTranslator()
+
+        def compile_css(css, prefix="descendant::"):
+            return etree.XPath(translator.css_to_xpath(css, prefix=prefix))
+
+        self.results = compile_css("div.SoaBEf", prefix="descendant-or-self::")
+        self.next_link = compile_css("a#pnnext", prefix="descendant-or-self::")
+        self.link = compile_css("a")
+        self.fields = {
+            "title": compile_css("div.MBeuO"),
+            "snippet": compile_css(".GI74Re"),
+            "date": compile_css(".LfVVr"),
+            "source": compile_css(".NUnG9d span"),
+        }
+        self.parsers = {}
+
+    def parser(self, encoding):
+        parser = self.parsers.get(encoding)
+        if parser is None:
+            parser = self.parsers[encoding] = lxml.html.HTMLParser(encoding=encoding)
+        return parser
+
+    def __call__(self, content, encoding="utf-8"):
+        if not content.strip():
+            return [], False
+        if isinstance(content, str):
+            content, encoding = content.encode("utf-8"), "utf-8"
+        try:
+            parser = self.parser(encoding)
+        except LookupError:
+            # a charset only Python's codecs know: decode here, parse as UTF-8
+            content = content.decode(encoding, "replace").encode("utf-8")
+            parser = self.parser("utf-8")
+        root = lxml.html.document_fromstring(content, parser=parser)
+        results_on_page = self.results(root)
+
+        news_results = []
+        for el in results_on_page:
+            try:
+                record = {"link": self.link(el)[0].attrib["href"]}
+                for field, selector in self.fields.items():
+                    record[field] = selector(el)[0].text_content()
+                news_results.append(record)
+            except (IndexError, KeyError) as e:
+                print(f"Error processing result: {e!r}")
+                # If one of the fields is not found, skip this result
+                continue
+
+        # No more results found, or no "Next" link (pagination)
+        has_more = bool(results_on_page) and bool(self.next_link(root))
+        return news_results, has_more
+
+
+NEWS_PARSERS = {
+    "lxml": LxmlNewsExtractor(),
+    "bs4": parse_news_page_bs4,
+}
+
+
+def parse_news_page(content, content_type=None):
+    """
+    Parse one Google News result page with the configured google_news_parser,
+    decoded as its Content-Type header or <meta> charset declares.
+    Returns the results on the page and whether to go on to the next page.
+    """
+    parser = get_config().get("google_news_parser", "lxml")
+    if parser not in NEWS_PARSERS:
+        raise ValueError(
+            f"Google News parser {parser} is not supported. Please choose from: {list(NEWS_PARSERS)}"
+        )
+    return NEWS_PARSERS[parser](content, page_encoding(content, content_type))
+
+
+NEWS_SEARCH_URL = "https://www.google.com/search"
+
+NEWS_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/101.0.4951.54 Safari/537.36"
+    )
+}
+
+
+def news_search_url(query, start_date, end_date, page, search_url=NEWS_SEARCH_URL):
+    """
+    URL of one page of Google News results.
+    start_date, end_date: str - in the format yyyy-mm-dd or mm/dd/yyyy
     """
     if "-" in start_date:
         start_date = datetime.strptime(start_date, "%Y-%m-%d")
@@ -45,64 +218,188 @@ def getNewsData(query, start_date, end_date):
         end_date = datetime.strptime(end_date, "%Y-%m-%d")
         end_date = end_date.strftime("%m/%d/%Y")
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/101.0.4951.54 Safari/537.36"
-        )
-    }
+    offset = page * 10
+    return (
+        f"{search_url}?q={query}"
+        f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
+        f"&tbm=nws&start={offset}"
+    )
+
+
+def getNewsData(query, start_date, end_date):
+    """
+    Scrape Google News search results for a given query and date range.
+    Results of complete, non-empty scrapes are kept in the on-disk news cache.
+    query: str - search query
+    start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
+    end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+    """
+    news_results = read_news_cache(query, start_date, end_date)
+    if news_results is not None:
+        return news_results
 
     news_results = []
     page = 0
     while True:
-        offset = page * 10
-        url = (
-            f"https://www.google.com/search?q={query}"
-            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
-            f"&tbm=nws&start={offset}"
-        )
+        url = news_search_url(query, start_date, end_date, page)
 
         try:
-            response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
-
-            if not results_on_page:
-                break  # No more results found
-
-            for el in results_on_page:
-                try:
-                    link = el.find("a")["href"]
-                    title = el.select_one("div.MBeuO").get_text()
-                    snippet = el.select_one(".GI74Re").get_text()
-                    date = el.select_one(".LfVVr").get_text()
-                    source = el.select_one(".NUnG9d span").get_text()
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
-                    continue
-
-            # Update the progress bar with the current count of results scraped
-
-            # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
+            response = make_request(url, NEWS_HEADERS)
+            results_on_page, has_more = parse_news_page(
+                response.content, response.headers.get("Content-Type")
+            )
+            news_results.extend(results_on_page)
+
+            if not has_more:
                 break
 
             page += 1
 
         except Exception as e:
             print(f"Failed after multiple retries: {e}")
-            break
+            # don't cache a partial scrape
+            return news_results
 
+    # an "unusual traffic" or consent page parses as an empty result page;
+    # keep only scrapes that actually returned results
+    if news_results:
+        write_news_cache(query, start_date, end_date, news_results)
     return news_results
+
+
+class TokenBucket:
+    """
+    Token bucket: tokens refill at `rate` per second up to `capacity`, and
+    every request takes one, waiting if none is left. Requests reserve their
+    token under a thread lock and then sleep until it is due, so one bucket
+    paces callers on any number of threads and event loops.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+_token_buckets = {}
+_token_buckets_lock = threading.Lock()
+
+
+def get_token_bucket(rate, capacity):
+    """Get the process-wide token bucket for a request rate and burst size."""
+    with _token_buckets_lock:
+        bucket = _token_buckets.get((rate, capacity))
+        if bucket is None:
+            bucket = _token_buckets[(rate, capacity)] = TokenBucket(rate, capacity)
+    return bucket
+
+
+class PageResponse:
+    """Status, body and content type of a fetched page, read before the connection is released."""
+
+    def __init__(self, status_code, content, content_type=None):
+        self.status_code = status_code
+        self.content = content
+        self.content_type = content_type
+
+
+@retry(
+    retry=(retry_if_result(is_rate_limited)),
+    wait=wait_exponential(multiplier=1, min=4, max=60),
+    stop=stop_after_attempt(5),
+)
+async def make_request_async(session, url, headers, limiter):
+    """Make a rate limited request on a shared session, with retry logic for rate limiting"""
+    await limiter.acquire()
+    async with session.get(url, headers=headers) as response:
+        return PageResponse(
+            response.status,
+            await response.read(),
+            response.headers.get("Content-Type"),
+        )
+
+
+async def getNewsDataAsync(
+    query,
+    start_date,
+    end_date,
+    max_concurrency=None,
+    requests_per_second=None,
+    search_url=NEWS_SEARCH_URL,
+):
+    """
+    Async variant of getNewsData. Pages are fetched on one pooled session.
+    The first page is fetched alone; once a page links to a next one, up to
+    max_concurrency pages are fetched at a time and parsed in order, so at
+    most max_concurrency - 1 requests past the last page are wasted, and a
+    single-page query costs one request. A process-wide token bucket, shared
+    by every concurrent scrape with the same rate, paces the requests
+    instead of random sleeps. Shares the on-disk news cache with
+    getNewsData. Defaults come from the google_news_* config keys.
+    """
+    news_results = read_news_cache(query, start_date, end_date)
+    if news_results is not None:
+        return news_results
+
+    config = get_config()
+    max_concurrency = max_concurrency or config["google_news_max_concurrency"]
+    requests_per_second = (
+        requests_per_second or config["google_news_requests_per_second"]
+    )
+    limiter = get_token_bucket(requests_per_second, max_concurrency)
+
+    news_results = []
+    connector = aiohttp.TCPConnector(limit=max_concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        page, batch_size = 0, 1
+        while True:
+            batch = [
+                make_request_async(
+                    session,
+                    news_search_url(query, start_date, end_date, p, search_url),
+                    NEWS_HEADERS,
+                    limiter,
+                )
+                for p in range(page, page + batch_size)
+            ]
+            responses = await asyncio.gather(*batch, return_exceptions=True)
+
+            for response in responses:
+                if isinstance(response, Exception):
+                    print(f"Failed after multiple retries: {response}")
+                    # don't cache a partial scrape
+                    return news_results
+
+                results_on_page, has_more = parse_news_page(
+                    response.content, response.content_type
+                )
+                news_results.extend(results_on_page)
+
+                if not has_more:
+                    # an "unusual traffic" or consent page parses as an empty
+                    # result page; keep only scrapes that returned results
+                    if news_results:
+                        write_news_cache(query, start_date, end_date, news_results)
+                    return news_results
+
+            page += batch_size
+            # prefetch only once the results are known to go on
+            batch_size = max_concurrency
@@ -0,0 +1,339 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Annotated, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from stockstats import wrap
+
+from .config import get_config
+from .indicator_kernels import compute_indicator_arrays, compute_numpy_indicators
+from .trading_calendar import TradingCalendar
+
+# indicators offered to the market analyst, see best_ind_params in interface.py
+SUPPORTED_INDICATORS = (
+    "close_50_sma",
+    "close_200_sma",
+    "close_10_ema",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "boll",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+    "mfi",
+)
+
+# Bars of history recomputed in front of newly arrived bars. Covers the longest
+# rolling window (200) and lets the exponential weights of the EMA/SMMA based
+# indicators decay below float precision, so appended rows agree with a full
+# pass up to rounding.
+WARMUP_BARS = 600
+
+MAX_MATRICES = 512
+
+
+def compute_stockstats_indicators(data: pd.DataFrame) -> np.ndarray:
+    """Compute every supported indicator with stockstats, one column each."""
+    df = wrap(data)
+    return np.column_stack(
+        [df[indicator].to_numpy(dtype=np.float64) for indicator in SUPPORTED_INDICATORS]
+    )
+
+
+INDICATOR_BACKENDS = {
+    "stockstats": compute_stockstats_indicators,
+    "numpy": compute_numpy_indicators,
+}
+
+
+class IndicatorMatrix:
+    """A date x indicator matrix of precomputed values for one symbol."""
+
+    def __init__(self, dates: np.ndarray, values: np.ndarray, last_close: float):
+        self.dates = np.asarray(dates, dtype="U10")
+        self.values = values
+        self.last_close = last_close
+        self.calendar = TradingCalendar(self.dates, assume_sorted=True)
+        self._cols = {name: j for j, name in enumerate(SUPPORTED_INDICATORS)}
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def get(
+        self,
+        indicator: Annotated[str, "one of SUPPORTED_INDICATORS"],
+        date: Annotated[str, "trading date, YYYY-mm-dd"],
+    ) -> Optional[np.float64]:
+        """Look up a single value, None if date is not a trading day."""
+        if date not in self.calendar:
+            return None
+        row = self.calendar.index_range(date, date).start
+        return self.values[row, self._cols[indicator]]
+
+    def window(
+        self,
+        indicator: Annotated[str, "one of SUPPORTED_INDICATORS"],
+        start_date: Annotated[str, "first date, YYYY-mm-dd"],
+        end_date: Annotated[str, "last date, YYYY-mm-dd"],
+    ) -> pd.Series:
+        """Values of one indicator for the trading days in [start_date, end_date]."""
+        rows = self.calendar.index_range(start_date, end_date)
+        return pd.Series(self.values[rows, self._cols[indicator]], index=self.dates[rows])
+
+    def save(self, path: str) -> None:
+        # write then rename, so concurrent readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                dates=self.dates,
+                values=self.values,
+                last_close=np.float64(self.last_close),
+                indicators=np.array(SUPPORTED_INDICATORS),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["IndicatorMatrix"]:
+        """The stored matrix, None if it is missing, unreadable or outdated."""
+        try:
+            with np.load(path, allow_pickle=False) as f:
+                if tuple(f["indicators"]) != SUPPORTED_INDICATORS:
+                    return None
+                return cls(f["dates"], f["values"], float(f["last_close"]))
+        except Exception:
+            # a damaged file is recomputed and overwritten
+            return None
+
+
+class IndicatorEngine:
+    """
+    Keeps one IndicatorMatrix per (symbol, source), computed in a single pass
+    over the price history and persisted next to the price cache. When the
+    price history gains bars, only the new rows are computed and appended.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        backend: Annotated[str, "one of INDICATOR_BACKENDS"] = "stockstats",
+    ):
+        if backend not in INDICATOR_BACKENDS:
+            raise ValueError(
+                f"Indicator backend {backend} is not supported. Please choose from: {list(INDICATOR_BACKENDS)}"
+            )
+        self.cache_dir = cache_dir
+        self.backend = backend
+        self.compute = INDICATOR_BACKENDS[backend]
+        self._matrices: "OrderedDict[Tuple[str, str], Tuple[str, IndicatorMatrix]]" = (
+            OrderedDict()
+        )
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _matrix_path(self, symbol: str, source: str) -> Optional[str]:
+        if self.cache_dir is None:
+            return None
+        return os.path.join(
+            self.cache_dir, f"{symbol}-YFin-indicators-{source}-{self.backend}.npz"
+        )
+
+    def _update(
+        self, matrix: Optional[IndicatorMatrix], data: pd.DataFrame
+    ) -> IndicatorMatrix:
+        dates = data["Date"].astype(str).str[:10].to_numpy()
+        closes = data["close" if "close" in data else "Close"].to_numpy(np.float64)
+
+        # reuse stored rows only if the history they were computed on is intact
+        if matrix is not None and len(matrix):
+            last = np.searchsorted(dates, matrix.dates[-1], "left")
+            if (
+                last == len(dates)
+                or dates[last] != matrix.dates[-1]
+                or closes[last] != matrix.last_close
+                or matrix.dates[0] > dates[0]
+            ):
+                matrix = None
+        else:
+            matrix = None
+
+        if matrix is None:
+            return IndicatorMatrix(dates, self.compute(data), closes[-1])
+
+        new_rows = len(dates) - last - 1
+        if new_rows == 0 and matrix.dates[0] == dates[0]:
+            return matrix
+
+        # drop rows that fell out of the front of the history
+        first = np.searchsorted(matrix.dates, dates[0], "left")
+        kept_dates = matrix.dates[first:]
+        kept_values = matrix.values[first:]
+        if new_rows == 0:
+            return IndicatorMatrix(kept_dates, kept_values, matrix.last_close)
+
+        warmup_start = max(0, last + 1 - WARMUP_BARS)
+        tail = self.compute(data.iloc[warmup_start:].reset_index(drop=True))
+        return IndicatorMatrix(
+            np.concatenate([kept_dates, dates[last + 1 :]]),
+            np.vstack([kept_values, tail[-new_rows:]]),
+            closes[-1],
+        )
+
+    def _lookup(self, key: Tuple[str, str]) -> Optional[Tuple[str, IndicatorMatrix]]:
+        with self._lock:
+            cached = self._matrices.get(key)
+            if cached is not None:
+                self._matrices.move_to_end(key)
+            return cached
+
+    def _refresh(
+        self,
+        key: Tuple[str, str],
+        cached: Optional[Tuple[str, IndicatorMatrix]],
+        version: str,
+        loader: Callable[[], pd.DataFrame],
+    ) -> IndicatorMatrix:
+        matrix = cached[1] if cached is not None else None
+        path = self._matrix_path(*key)
+        if matrix is None and path is not None and os.path.exists(path):
+            matrix = IndicatorMatrix.load(path)
+
+        updated = self._update(matrix, loader())
+        if path is not None and updated is not matrix:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            updated.save(path)
+
+        with self._lock:
+            self._matrices[key] = (version, updated)
+            self._matrices.move_to_end(key)
+            while len(self._matrices) > MAX_MATRICES:
+                self._matrices.popitem(last=False)
+        return updated
+
+    def get_matrix(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        source: Annotated[str, "where the prices come from, e.g. offline/online"],
+        version: Annotated[str, "identifies the price history, e.g. its date range"],
+        loader: Annotated[
+            Callable[[], pd.DataFrame], "loads the price history if the matrix is stale"
+        ],
+    ) -> IndicatorMatrix:
+        key = (symbol, source)
+        cached = self._lookup(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # only one thread computes a given matrix; the others wait and reuse it
+        with key_lock:
+            cached = self._lookup(key)
+            if cached is not None and cached[0] == version:
+                updated = cached[1]
+            else:
+                updated = self._refresh(key, cached, version, loader)
+
+        with self._lock:
+            self._key_locks.pop(key, None)
+        return updated
+
+
+_engines: Dict[Tuple[str, str], IndicatorEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_indicator_engine() -> IndicatorEngine:
+    """Get the process-wide indicator engine for the configured cache directory and backend."""
+    config = get_config()
+    key = (config["data_cache_dir"], config["indicator_backend"])
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = _engines[key] = IndicatorEngine(*key)
+    return engine
+
+
+def compute_indicator_panel(
+    prices: Annotated[
+        Dict[str, pd.DataFrame], "price history per symbol, with a YYYY-mm-dd Date column"
+    ],
+    indicators: Annotated[List[str], "subset of SUPPORTED_INDICATORS"],
+    start_date: Annotated[str, "first date to report, YYYY-mm-dd"],
+    end_date: Annotated[str, "last date to report, YYYY-mm-dd"],
+) -> pd.DataFrame:
+    """
+    Compute indicators for many symbols at once with the NumPy kernels.
+
+    The histories are aligned into (date x symbol) panels on the union of
+    their trading days. Each column is then packed so that the symbol's own
+    bars are contiguous from the top, which keeps windows and warm-up
+    positions identical to a per-symbol computation, and every indicator is
+    computed across all columns in one vectorized pass. Returns a tidy frame
+    with Symbol, Date, Indicator and Value columns covering the trading days
+    of each symbol in [start_date, end_date].
+
+    The NumPy kernels are used regardless of indicator_backend, and the
+    different summation order means values can differ from a per-symbol
+    IndicatorMatrix in the last digits.
+    """
+    for indicator in indicators:
+        if indicator not in SUPPORTED_INDICATORS:
+            raise ValueError(
+                f"Indicator {indicator} is not supported. Please choose from: {list(SUPPORTED_INDICATORS)}"
+            )
+
+    symbols = list(prices)
+    if not symbols:
+        return pd.DataFrame(columns=["Symbol", "Date", "Indicator", "Value"])
+
+    symbol_dates = [prices[symbol]["Date"].to_numpy(dtype="U10") for symbol in symbols]
+    dates = symbol_dates[0]
+    for other in symbol_dates[1:]:
+        if not np.array_equal(other, dates):
+            dates = np.union1d(dates, other)
+
+    fields = [np.full((len(dates), len(symbols)), np.nan) for _ in range(4)]
+    for j, symbol in enumerate(symbols):
+        data = prices[symbol]
+        columns = {c.lower(): c for c in data.columns}
+        if np.array_equal(symbol_dates[j], dates):
+            rows = slice(None)
+        else:
+            rows = np.searchsorted(dates, symbol_dates[j])
+        for field, name in zip(fields, ("close", "high", "low", "volume")):
+            field[rows, j] = data[columns[name]].to_numpy(np.float64)
+
+    # move each symbol's bars to the top of its column, missing dates last
+    order = np.argsort(np.isnan(fields[0]), axis=0, kind="stable")
+    packed = [np.take_along_axis(field, order, axis=0) for field in fields]
+    results = compute_indicator_arrays(*packed)
+
+    lo = np.searchsorted(dates, start_date, "left")
+    hi = np.searchsorted(dates, end_date, "right")
+    traded = ~np.isnan(fields[0][lo:hi])
+    date_idx, symbol_idx = np.nonzero(traded)
+
+    tidy = []
+    for indicator in indicators:
+        values = np.empty_like(fields[0])
+        np.put_along_axis(
+            values, order, results[SUPPORTED_INDICATORS.index(indicator)], axis=0
+        )
+        tidy.append(
+            pd.DataFrame(
+                {
+                    "Symbol": np.asarray(symbols, dtype=object)[symbol_idx],
+                    "Date": dates[lo:hi][date_idx],
+                    "Indicator": indicator,
+                    "Value": values[lo:hi][traded],
+                }
+            )
+        )
+    return pd.concat(tidy, ignore_index=True)
@@ -0,0 +1,182 @@
+"""
+Vectorized NumPy kernels for the indicators in SUPPORTED_INDICATORS.
+
+They follow the definitions used by stockstats (rolling windows with
+min_periods=1, adjusted exponential weights, Wilder smoothing as an EMA with
+alpha=1/n) so the two backends can be swapped, but work on plain float arrays
+without wrapping and copying the price frame. Every kernel runs along axis 0,
+so it accepts either a single series or a (bar x symbol) panel.
+"""
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sum over the trailing window, partial windows at the start."""
+    cs = np.cumsum(x, axis=0)
+    out = cs.copy()
+    out[window:] = cs[window:] - cs[:-window]
+    return out
+
+
+def sma(x: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average from a cumulative sum."""
+    counts = np.minimum(np.arange(1, len(x) + 1), window)
+    if x.ndim > 1:
+        counts = counts[:, None]
+    return rolling_sum(x, window) / counts
+
+
+def rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """Sample standard deviation over the trailing window."""
+    out = np.full(x.shape, np.nan)
+    if len(x) >= window:
+        windows = sliding_window_view(x, window, axis=0)
+        out[window - 1 :] = windows.std(axis=-1, ddof=1)
+    # partial windows at the start
+    for i in range(1, min(window - 1, len(x))):
+        out[i] = x[: i + 1].std(axis=0, ddof=1)
+    return out
+
+
+def ewm_mean(x: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Exponentially weighted mean with adjusted weights, i.e. the recursive
+    form of sum((1 - alpha)**i * x[t - i]) / sum((1 - alpha)**i).
+    """
+    out = np.empty(x.shape)
+    if len(x) == 0:
+        return out
+    if x.ndim > 1:
+        return _ewm_mean_panel(x, alpha, out)
+
+    decay = 1.0 - alpha
+    values = x.tolist()
+    weighted = values[0]
+    old_wt = 1.0
+    out[0] = weighted
+    for i in range(1, len(values)):
+        cur = values[i]
+        if weighted == weighted:
+            old_wt *= decay
+            if cur == cur:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + cur) / (old_wt + 1.0)
+                old_wt += 1.0
+        elif cur == cur:
+            weighted = cur
+        out[i] = weighted
+    return out
+
+
+def _ewm_mean_panel(x: np.ndarray, alpha: float, out: np.ndarray) -> np.ndarray:
+    """
+    ewm_mean stepping through the bars once, vectorized across columns.
+    Columns must start with an observation; a NaN ends the column's data.
+    """
+    decay = 1.0 - alpha
+    old_wt = 1.0
+    out[0] = x[0]
+    blended = np.empty(x.shape[1:])
+    for i in range(1, len(x)):
+        weighted, cur = out[i - 1], x[i]
+        old_wt *= decay
+        np.multiply(weighted, old_wt, out=blended)
+        blended += cur
+        blended /= old_wt + 1.0
+        old_wt += 1.0
+        out[i] = weighted
+        np.copyto(out[i], blended, where=weighted != cur)
+    return out
+
+
+def ema(x: np.ndarray, span: int) -> np.ndarray:
+    return ewm_mean(x, 2.0 / (span + 1.0))
+
+
+def smma(x: np.ndarray, window: int) -> np.ndarray:
+    """Wilder's smoothed moving average."""
+    return ewm_mean(x, 1.0 / window)
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    prev_close = np.empty_like(close)
+    prev_close[0] = close[0]
+    prev_close[1:] = close[:-1]
+    tr = np.maximum(
+        high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close))
+    )
+    return np.nan_to_num(tr)
+
+
+def rsi(close: np.ndarray, window: int = 14) -> np.ndarray:
+    diff = np.zeros_like(close)
+    diff[1:] = np.diff(close, axis=0)
+    up = smma(np.where(diff > 0, diff, 0.0), window)
+    down = smma(np.where(diff < 0, -diff, 0.0), window)
+    total = up + down
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(total != 0, 100 * (up / total), 50.0)
+    out[0] = 50.0
+    return out
+
+
+def vwma(tp: np.ndarray, volume: np.ndarray, window: int = 14) -> np.ndarray:
+    tpv = rolling_sum(tp * volume, window)
+    vol = rolling_sum(volume, window)
+    return np.divide(tpv, vol, out=np.zeros_like(tpv), where=vol != 0)
+
+
+def mfi(tp: np.ndarray, volume: np.ndarray, window: int = 14) -> np.ndarray:
+    raw_money_flow = tp * volume
+    tp_diff = np.zeros_like(tp)
+    tp_diff[1:] = np.diff(tp, axis=0)
+    pos_sum = rolling_sum(np.where(tp_diff > 0, raw_money_flow, 0.0), window)
+    neg_sum = rolling_sum(np.where(tp_diff < 0, raw_money_flow, 0.0), window)
+    total = pos_sum + neg_sum
+    out = np.divide(pos_sum, total, out=np.full_like(pos_sum, 0.5), where=total > 0)
+    out[:window] = 0.5
+    return out
+
+
+def compute_indicator_arrays(
+    close: np.ndarray, high: np.ndarray, low: np.ndarray, volume: np.ndarray
+) -> list:
+    """Compute every supported indicator, in the order of SUPPORTED_INDICATORS."""
+    tp = (close + high + low) / 3.0
+
+    macd = ema(close, 12) - ema(close, 26)
+    macds = ema(macd, 9)
+    boll = sma(close, 20)
+    boll_width = 2 * rolling_std(close, 20)
+
+    return [
+        sma(close, 50),
+        sma(close, 200),
+        ema(close, 10),
+        macd,
+        macds,
+        macd - macds,
+        rsi(close, 14),
+        boll,
+        boll + boll_width,
+        boll - boll_width,
+        smma(true_range(high, low, close), 14),
+        vwma(tp, volume, 14),
+        mfi(tp, volume, 14),
+    ]
+
+
+def compute_numpy_indicators(data: pd.DataFrame) -> np.ndarray:
+    """Compute every supported indicator with the NumPy kernels, one column each."""
+    columns = {c.lower(): c for c in data.columns}
+    return np.column_stack(
+        compute_indicator_arrays(
+            *(
+                data[columns[name]].to_numpy(np.float64)
+                for name in ("close", "high", "low", "volume")
+            )
+        )
+    )
@@ -1,18 +1,22 @@
-from typing import Annotated, Dict
-from .reddit_utils import fetch_top_from_category
+from typing import Annotated, Dict, List, Optional
+from .reddit_utils import fetch_top_from_category_window
 from .yfin_utils import *
 from .stockstats_utils import *
 from .googlenews_utils import *
 from .finnhub_utils import get_data_in_range
+from .price_store import get_offline_price_data
+from .simfin_store import get_simfin_store
+from .response_cache import get_response_cache
+from .openai_clients import get_async_openai_client, get_openai_client
+from .trading_calendar import TradingCalendar, calendar_days
 from dateutil.relativedelta import relativedelta
 from concurrent.futures import ThreadPoolExecutor
+import asyncio
 from datetime import datetime
 import json
 import os
 import pandas as pd
-from tqdm import tqdm
 import yfinance as yf
-from openai import OpenAI
 from .config import get_config, set_config, DATA_DIR
 
 
@@ -141,43 +145,18 @@ def get_finnhub_company_insider_transactions(
     )
 
 
-def get_simfin_balance_sheet(
+def _format_simfin_balance_sheet(
     ticker: Annotated[str, "ticker symbol"],
-    freq: Annotated[
-        str,
-        "reporting frequency of the company's financial history: annual / quarterly",
+    freq: Annotated[str, "annual / quarterly"],
+    latest_balance_sheet: Annotated[
+        Optional[pd.Series], "the report row, None if there is none"
     ],
-    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
-):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "balance_sheet",
-        "companies",
-        "us",
-        f"us-balance-{freq}.csv",
-    )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
-
+) -> str:
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_balance_sheet is None:
         print("No balance sheet available before the given current date.")
         return ""
 
-    # Get the most recent balance sheet by selecting the row with the latest Publish Date
-    latest_balance_sheet = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_balance_sheet = latest_balance_sheet.drop("SimFinId")
 
@@ -188,7 +167,7 @@ def get_simfin_balance_sheet(
     )
 
 
-def get_simfin_cashflow(
+def get_simfin_balance_sheet(
     ticker: Annotated[str, "ticker symbol"],
     freq: Annotated[
         str,
@@ -196,35 +175,26 @@ def get_simfin_cashflow(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "cash_flow",
-        "companies",
-        "us",
-        f"us-cashflow-{freq}.csv",
+    # Get the most recent balance sheet published on or before the current date
+    latest_balance_sheet = get_simfin_store(DATA_DIR).latest_report(
+        ticker, "balance_sheet", freq, curr_date
     )
-    df = pd.read_csv(data_path, sep=";")
 
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+    return _format_simfin_balance_sheet(ticker, freq, latest_balance_sheet)
 
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
 
+def _format_simfin_cash_flow(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[str, "annual / quarterly"],
+    latest_cash_flow: Annotated[
+        Optional[pd.Series], "the report row, None if there is none"
+    ],
+) -> str:
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_cash_flow is None:
         print("No cash flow statement available before the given current date.")
         return ""
 
-    # Get the most recent cash flow statement by selecting the row with the latest Publish Date
-    latest_cash_flow = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_cash_flow = latest_cash_flow.drop("SimFinId")
 
@@ -235,7 +205,7 @@ def get_simfin_cashflow(
     )
 
 
-def get_simfin_income_statements(
+def get_simfin_cashflow(
     ticker: Annotated[str, "ticker symbol"],
     freq: Annotated[
         str,
@@ -243,35 +213,26 @@ def get_simfin_income_statements(
     ],
     curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
 ):
-    data_path = os.path.join(
-        DATA_DIR,
-        "fundamental_data",
-        "simfin_data_all",
-        "income_statements",
-        "companies",
-        "us",
-        f"us-income-{freq}.csv",
+    # Get the most recent cash flow statement published on or before the current date
+    latest_cash_flow = get_simfin_store(DATA_DIR).latest_report(
+        ticker, "cash_flow", freq, curr_date
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
 
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+    return _format_simfin_cash_flow(ticker, freq, latest_cash_flow)
 
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
 
+def _format_simfin_income_statements(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[str, "annual / quarterly"],
+    latest_income: Annotated[
+        Optional[pd.Series], "the report row, None if there is none"
+    ],
+) -> str:
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_income is None:
         print("No income statement available before the given current date.")
         return ""
 
-    # Get the most recent income statement by selecting the row with the latest Publish Date
-    latest_income = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_income = latest_income.drop("SimFinId")
 
@@ -282,19 +243,73 @@ def get_simfin_income_statements(
     )
 
 
-def get_google_news(
-    query: Annotated[str, "Query to search with"],
-    curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
-    look_back_days: Annotated[int, "how many days to look back"],
-) -> str:
+def get_simfin_income_statements(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+):
+    # Get the most recent income statement published on or before the current date
+    latest_income = get_simfin_store(DATA_DIR).latest_report(
+        ticker, "income_statements", freq, curr_date
+    )
+
+    return _format_simfin_income_statements(ticker, freq, latest_income)
+
+
+_simfin_formatters = {
+    "balance_sheet": _format_simfin_balance_sheet,
+    "cash_flow": _format_simfin_cash_flow,
+    "income_statements": _format_simfin_income_statements,
+}
+
+
+def get_simfin_statements_as_of(
+    ticker: Annotated[str, "ticker symbol"],
+    statement: Annotated[str, "balance_sheet / cash_flow / income_statements"],
+    freq: Annotated[
+        str,
+        "reporting frequency of the company's financial history: annual / quarterly",
+    ],
+    curr_dates: Annotated[List[str], "trade dates to report on, yyyy-mm-dd"],
+) -> Dict[str, str]:
+    """
+    Point-in-time version of the SimFin tools for backtests. The latest
+    report published on or before every date is found in one vectorized
+    as-of lookup, and each distinct report is formatted only once. Returns
+    {date: report} with the same text the single-date tools produce.
+    """
+    if statement not in _simfin_formatters:
+        raise ValueError(
+            f"Statement {statement} is not supported. Please choose from: {list(_simfin_formatters)}"
+        )
+
+    reports = get_simfin_store(DATA_DIR).reports_as_of(
+        ticker, statement, freq, curr_dates
+    )
+
+    formatted = {}
+    results = {}
+    for curr_date, report in zip(curr_dates, reports):
+        key = None if report is None else report.name
+        if key not in formatted:
+            formatted[key] = _simfin_formatters[statement](ticker, freq, report)
+        results[curr_date] = formatted[key]
+    return results
+
+
+def _google_news_window(query, curr_date, look_back_days):
     query = query.replace(" ", "+")
 
     start_date = datetime.strptime(curr_date, "%Y-%m-%d")
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
+    return query, before
 
-    news_results = getNewsData(query, before, curr_date)
 
+def _format_google_news(query, before, curr_date, news_results):
     news_str = ""
 
     for news in news_results:
@@ -308,6 +323,35 @@ def get_google_news(
     return f"## {query} Google News, from {before} to {curr_date}:\n\n{news_str}"
 
 
+def get_google_news(
+    query: Annotated[str, "Query to search with"],
+    curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "how many days to look back"],
+) -> str:
+    query, before = _google_news_window(query, curr_date, look_back_days)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        news_results = asyncio.run(getNewsDataAsync(query, before, curr_date))
+    else:
+        # already inside an event loop, where asyncio.run is not allowed
+        news_results = getNewsData(query, before, curr_date)
+
+    return _format_google_news(query, before, curr_date, news_results)
+
+
+async def aget_google_news(
+    query: Annotated[str, "Query to search with"],
+    curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "how many days to look back"],
+) -> str:
+    """Async version of get_google_news, scraping on the running event loop."""
+    query, before = _google_news_window(query, curr_date, look_back_days)
+    news_results = await getNewsDataAsync(query, before, curr_date)
+    return _format_google_news(query, before, curr_date, news_results)
+
+
 def get_reddit_global_news(
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     look_back_days: Annotated[int, "how many days to look back"],
@@ -326,26 +370,15 @@ def get_reddit_global_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
-
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(desc=f"Getting Global News on {start_date}", total=total_iterations)
-
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "global_news",
-            curr_date_str,
-            max_limit_per_day,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-        pbar.update(1)
-
-    pbar.close()
+    # one pass over each subreddit file for the whole window
+    posts = fetch_top_from_category_window(
+        "global_news",
+        before,
+        start_date.strftime("%Y-%m-%d"),
+        max_limit_per_day,
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
+    )
+    curr_date = start_date + relativedelta(days=1)
 
     if len(posts) == 0:
         return ""
@@ -380,31 +413,16 @@ def get_reddit_company_news(
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = datetime.strptime(before, "%Y-%m-%d")
-
-    total_iterations = (start_date - curr_date).days + 1
-    pbar = tqdm(
-        desc=f"Getting Company News for {ticker} on {start_date}",
-        total=total_iterations,
+    # one pass over each subreddit file for the whole window
+    posts = fetch_top_from_category_window(
+        "company_news",
+        before,
+        start_date.strftime("%Y-%m-%d"),
+        max_limit_per_day,
+        ticker,
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
     )
-
-    while curr_date <= start_date:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "company_news",
-            curr_date_str,
-            max_limit_per_day,
-            ticker,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-
-        pbar.update(1)
-
-    pbar.close()
+    curr_date = start_date + relativedelta(days=1)
 
     if len(posts) == 0:
         return ""
@@ -419,6 +437,120 @@ def get_reddit_company_news(
     return f"##{ticker} News Reddit, from {before} to {curr_date}:\n\n{news_str}"
 
 
+best_ind_params = {
+    # Moving Averages
+    "close_50_sma": (
+        "50 SMA: A medium-term trend indicator. "
+        "Usage: Identify trend direction and serve as dynamic support/resistance. "
+        "Tips: It lags price; combine with faster indicators for timely signals."
+    ),
+    "close_200_sma": (
+        "200 SMA: A long-term trend benchmark. "
+        "Usage: Confirm overall market trend and identify golden/death cross setups. "
+        "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
+    ),
+    "close_10_ema": (
+        "10 EMA: A responsive short-term average. "
+        "Usage: Capture quick shifts in momentum and potential entry points. "
+        "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
+    ),
+    # MACD Related
+    "macd": (
+        "MACD: Computes momentum via differences of EMAs. "
+        "Usage: Look for crossovers and divergence as signals of trend changes. "
+        "Tips: Confirm with other indicators in low-volatility or sideways markets."
+    ),
+    "macds": (
+        "MACD Signal: An EMA smoothing of the MACD line. "
+        "Usage: Use crossovers with the MACD line to trigger trades. "
+        "Tips: Should be part of a broader strategy to avoid false positives."
+    ),
+    "macdh": (
+        "MACD Histogram: Shows the gap between the MACD line and its signal. "
+        "Usage: Visualize momentum strength and spot divergence early. "
+        "Tips: Can be volatile; complement with additional filters in fast-moving markets."
+    ),
+    # Momentum Indicators
+    "rsi": (
+        "RSI: Measures momentum to flag overbought/oversold conditions. "
+        "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
+        "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
+    ),
+    # Volatility Indicators
+    "boll": (
+        "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
+        "Usage: Acts as a dynamic benchmark for price movement. "
+        "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
+    ),
+    "boll_ub": (
+        "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
+        "Usage: Signals potential overbought conditions and breakout zones. "
+        "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
+    ),
+    "boll_lb": (
+        "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
+        "Usage: Indicates potential oversold conditions. "
+        "Tips: Use additional analysis to avoid false reversal signals."
+    ),
+    "atr": (
+        "ATR: Averages true range to measure volatility. "
+        "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
+        "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
+    ),
+    # Volume-Based Indicators
+    "vwma": (
+        "VWMA: A moving average weighted by volume. "
+        "Usage: Confirm trends by integrating price action with volume data. "
+        "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+    ),
+    "mfi": (
+        "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
+        "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
+        "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
+    ),
+}
+
+
+def _format_indicator_window(
+    indicator: Annotated[str, "technical indicator the values belong to"],
+    ind_values: Annotated[
+        Optional[pd.Series], "indicator values indexed by YYYY-mm-dd, None on error"
+    ],
+    end_date: Annotated[str, "last date of the window, YYYY-mm-dd"],
+    before: Annotated[datetime, "first date of the window"],
+    online: Annotated[bool, "whether the values were fetched online"],
+) -> str:
+    ind_string = ""
+    if not online:
+        # only do the trading dates
+        if ind_values is not None:
+            for date_str, indicator_value in ind_values[::-1].items():
+                ind_string += f"{date_str}: {indicator_value}\n"
+    else:
+        # online gathering, every calendar day with the trading days filled in
+        days = calendar_days(before.strftime("%Y-%m-%d"), end_date)[::-1]
+        if ind_values is None:
+            ind_string = "".join(f"{date_str}: \n" for date_str in days)
+        else:
+            calendar = TradingCalendar(ind_values.index)
+            for date_str, traded in zip(days, calendar.is_session(days)):
+                indicator_value = (
+                    ind_values[date_str]
+                    if traded
+                    else "N/A: Not a trading day (weekend or holiday)"
+                )
+                ind_string += f"{date_str}: {indicator_value}\n"
+
+    result_str = (
+        f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
+        + ind_string
+        + "\n\n"
+        + best_ind_params.get(indicator, "No description available.")
+    )
+
+    return result_str
+
+
 def get_stock_stats_indicators_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -429,79 +561,6 @@ def get_stock_stats_indicators_window(
     online: Annotated[bool, "to fetch data online or offline"],
 ) -> str:
 
-    best_ind_params = {
-        # Moving Averages
-        "close_50_sma": (
-            "50 SMA: A medium-term trend indicator. "
-            "Usage: Identify trend direction and serve as dynamic support/resistance. "
-            "Tips: It lags price; combine with faster indicators for timely signals."
-        ),
-        "close_200_sma": (
-            "200 SMA: A long-term trend benchmark. "
-            "Usage: Confirm overall market trend and identify golden/death cross setups. "
-            "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
-        ),
-        "close_10_ema": (
-            "10 EMA: A responsive short-term average. "
-            "Usage: Capture quick shifts in momentum and potential entry points. "
-            "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
-        ),
-        # MACD Related
-        "macd": (
-            "MACD: Computes momentum via differences of EMAs. "
-            "Usage: Look for crossovers and divergence as signals of trend changes. "
-            "Tips: Confirm with other indicators in low-volatility or sideways markets."
-        ),
-        "macds": (
-            "MACD Signal: An EMA smoothing of the MACD line. "
-            "Usage: Use crossovers with the MACD line to trigger trades. "
-            "Tips: Should be part of a broader strategy to avoid false positives."
-        ),
-        "macdh": (
-            "MACD Histogram: Shows the gap between the MACD line and its signal. "
-            "Usage: Visualize momentum strength and spot divergence early. "
-            "Tips: Can be volatile; complement with additional filters in fast-moving markets."
-        ),
-        # Momentum Indicators
-        "rsi": (
-            "RSI: Measures momentum to flag overbought/oversold conditions. "
-            "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
-            "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
-        ),
-        # Volatility Indicators
-        "boll": (
-            "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
-            "Usage: Acts as a dynamic benchmark for price movement. "
-            "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
-        ),
-        "boll_ub": (
-            "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
-            "Usage: Signals potential overbought conditions and breakout zones. "
-            "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
-        ),
-        "boll_lb": (
-            "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
-            "Usage: Indicates potential oversold conditions. "
-            "Tips: Use additional analysis to avoid false reversal signals."
-        ),
-        "atr": (
-            "ATR: Averages true range to measure volatility. "
-            "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
-            "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
-        ),
-        # Volume-Based Indicators
-        "vwma": (
-            "VWMA: A moving average weighted by volume. "
-            "Usage: Confirm trends by integrating price action with volume data. "
-            "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-        ),
-        "mfi": (
-            "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
-            "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
-            "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
-        ),
-    }
-
     if indicator not in best_ind_params:
         raise ValueError(
             f"Indicator {indicator} is not supported. Please choose from: {list(best_ind_params.keys())}"
@@ -511,48 +570,89 @@ def get_stock_stats_indicators_window(
     curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date - relativedelta(days=look_back_days)
 
-    if not online:
-        # read from YFin data
-        data = pd.read_csv(
-            os.path.join(
-                DATA_DIR,
-                f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-            )
+    # compute the indicator series once and slice the whole window from it
+    try:
+        ind_values = StockstatsUtils.get_stock_stats_range(
+            symbol,
+            indicator,
+            before.strftime("%Y-%m-%d"),
+            end_date,
+            os.path.join(DATA_DIR, "market_data", "price_data"),
+            online=online,
         )
-        data["Date"] = pd.to_datetime(data["Date"], utc=True)
-        dates_in_df = data["Date"].astype(str).str[:10]
-
-        ind_string = ""
-        while curr_date >= before:
-            # only do the trading dates
-            if curr_date.strftime("%Y-%m-%d") in dates_in_df.values:
-                indicator_value = get_stockstats_indicator(
-                    symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-                )
+    except Exception as e:
+        if not online:
+            # a missing or unreadable offline price file is an error for the caller
+            raise
+        # online gathering reports blank values, as the per-day lookups did
+        print(
+            f"Error getting stockstats indicator data for indicator {indicator} from {before.strftime('%Y-%m-%d')} to {end_date}: {e}"
+        )
+        ind_values = None
 
-                ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
+    return _format_indicator_window(indicator, ind_values, end_date, before, online)
 
-            curr_date = curr_date - relativedelta(days=1)
-    else:
-        # online gathering
-        ind_string = ""
-        while curr_date >= before:
-            indicator_value = get_stockstats_indicator(
-                symbol, indicator, curr_date.strftime("%Y-%m-%d"), online
-            )
 
-            ind_string += f"{curr_date.strftime('%Y-%m-%d')}: {indicator_value}\n"
+def get_stock_stats_indicators_window_batch(
+    symbols: Annotated[List[str], "ticker symbols of the companies"],
+    indicators: Annotated[
+        List[str], "technical indicators to get the analysis and report of"
+    ],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+    look_back_days: Annotated[int, "how many days to look back"],
+    online: Annotated[bool, "to fetch data online or offline"],
+) -> Dict[str, Dict[str, str]]:
+    """
+    Batch version of get_stock_stats_indicators_window for screening a universe.
+    With the numpy indicator_backend all symbols are aligned into one panel and
+    each indicator is computed across them at once, matching the single-symbol
+    reports up to rounding in the last digits; with stockstats the values come
+    from the same per-symbol matrices, so the reports are identical. Returns
+    the per-symbol reports as {symbol: {indicator: report}}.
+    """
+    for indicator in indicators:
+        if indicator not in best_ind_params:
+            raise ValueError(
+                f"Indicator {indicator} is not supported. Please choose from: {list(best_ind_params.keys())}"
+            )
 
-            curr_date = curr_date - relativedelta(days=1)
+    end_date = curr_date
+    before = datetime.strptime(curr_date, "%Y-%m-%d") - relativedelta(
+        days=look_back_days
+    )
 
-    result_str = (
-        f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
-        + ind_string
-        + "\n\n"
-        + best_ind_params.get(indicator, "No description available.")
+    ind_panel = StockstatsUtils.get_stock_stats_panel(
+        symbols,
+        indicators,
+        before.strftime("%Y-%m-%d"),
+        end_date,
+        os.path.join(DATA_DIR, "market_data", "price_data"),
+        online=online,
     )
 
-    return result_str
+    ind_values = {
+        key: pd.Series(group["Value"].values, index=group["Date"].values)
+        for key, group in ind_panel.groupby(["Symbol", "Indicator"], sort=False)
+    }
+
+    return {
+        symbol: {
+            indicator: _format_indicator_window(
+                indicator,
+                ind_values.get(
+                    (symbol, indicator),
+                    pd.Series(dtype=float) if symbol in ind_panel["Symbol"].values else None,
+                ),
+                end_date,
+                before,
+                online,
+            )
+            for indicator in indicators
+        }
+        for symbol in symbols
+    }
 
 
 def get_stockstats_indicator(
@@ -594,25 +694,14 @@ def get_YFin_data_window(
     before = date_obj - relativedelta(days=look_back_days)
     start_date = before.strftime("%Y-%m-%d")
 
-    # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
+    # read in data between the start and end dates (inclusive)
+    filtered_data = get_offline_price_data(
+        symbol,
+        os.path.join(DATA_DIR, "market_data", "price_data"),
+        start_date,
+        curr_date,
     )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
-    # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= curr_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
-
     # Set pandas display options to show the full DataFrame
     with pd.option_context(
         "display.max_rows", None, "display.max_columns", None, "display.width", None
@@ -672,29 +761,18 @@ def get_YFin_data(
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     end_date: Annotated[str, "End date in yyyy-mm-dd format"],
 ) -> str:
-    # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
-
     if end_date > "2025-03-25":
         raise Exception(
             f"Get_YFin_Data: {end_date} is outside of the data range of 2015-01-01 to 2025-03-25"
         )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
-    # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    # read in data between the start and end dates (inclusive)
+    filtered_data = get_offline_price_data(
+        symbol,
+        os.path.join(DATA_DIR, "market_data", "price_data"),
+        start_date,
+        end_date,
+    )
 
     # remove the index from the dataframe
     filtered_data = filtered_data.reset_index(drop=True)
@@ -702,11 +780,10 @@ def get_YFin_data(
     return filtered_data
 
 
-def get_stock_news_openai(ticker, curr_date):
+def _openai_web_search_request(prompt):
+    """Arguments of a web-search enabled responses.create call for prompt."""
     config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
-
-    response = client.responses.create(
+    return dict(
         model=config["quick_think_llm"],
         input=[
             {
@@ -714,7 +791,7 @@ def get_stock_news_openai(ticker, curr_date):
                 "content": [
                     {
                         "type": "input_text",
-                        "text": f"Can you search Social Media for {ticker} from 7 days before {curr_date} to {curr_date}? Make sure you only get the data posted during that period.",
+                        "text": prompt,
                     }
                 ],
             }
@@ -734,74 +811,97 @@ def get_stock_news_openai(ticker, curr_date):
         store=True,
     )
 
+
+def _openai_web_search(prompt):
+    """Run one web-search enabled request and return the text of the answer."""
+    client = get_openai_client(get_config()["backend_url"])
+    response = client.responses.create(**_openai_web_search_request(prompt))
     return response.output[1].content[0].text
 
 
-def get_global_news_openai(curr_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+async def _aopenai_web_search(prompt):
+    """Async version of _openai_web_search."""
+    client = get_async_openai_client(get_config()["backend_url"])
+    response = await client.responses.create(**_openai_web_search_request(prompt))
+    return response.output[1].content[0].text
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"Can you search global or macroeconomics news from 7 days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period.",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
+
+def _cached_openai_web_search(function, ticker, curr_date, prompt):
+    """
+    _openai_web_search through the persistent response cache, keyed by
+    (function, ticker, date, model). Concurrent calls for the same key
+    share one request.
+    """
+    key = (function, ticker, curr_date, get_config()["quick_think_llm"])
+    return get_response_cache().get_or_compute(
+        key, lambda: _openai_web_search(prompt)
     )
 
-    return response.output[1].content[0].text
 
+async def _acached_openai_web_search(function, ticker, curr_date, prompt):
+    """Async version of _cached_openai_web_search."""
+    key = (function, ticker, curr_date, get_config()["quick_think_llm"])
+    return await get_response_cache().aget_or_compute(
+        key, lambda: _aopenai_web_search(prompt)
+    )
 
-def get_fundamentals_openai(ticker, curr_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to the month of {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
+def _stock_news_prompt(ticker, curr_date):
+    return f"Can you search Social Media for {ticker} from 7 days before {curr_date} to {curr_date}? Make sure you only get the data posted during that period."
+
+
+def _global_news_prompt(curr_date):
+    return f"Can you search global or macroeconomics news from 7 days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period."
+
+
+def _fundamentals_prompt(ticker, curr_date):
+    return f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to the month of {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc"
+
+
+def get_stock_news_openai(ticker, curr_date):
+    return _cached_openai_web_search(
+        "get_stock_news_openai",
+        ticker,
+        curr_date,
+        _stock_news_prompt(ticker, curr_date),
     )
 
-    return response.output[1].content[0].text
+
+async def aget_stock_news_openai(ticker, curr_date):
+    return await _acached_openai_web_search(
+        "get_stock_news_openai",
+        ticker,
+        curr_date,
+        _stock_news_prompt(ticker, curr_date),
+    )
+
+
+def get_global_news_openai(curr_date):
+    # the same for every ticker, so it is requested once per date
+    return _cached_openai_web_search(
+        "get_global_news_openai", "", curr_date, _global_news_prompt(curr_date)
+    )
+
+
+async def aget_global_news_openai(curr_date):
+    return await _acached_openai_web_search(
+        "get_global_news_openai", "", curr_date, _global_news_prompt(curr_date)
+    )
+
+
+def get_fundamentals_openai(ticker, curr_date):
+    return _cached_openai_web_search(
+        "get_fundamentals_openai",
+        ticker,
+        curr_date,
+        _fundamentals_prompt(ticker, curr_date),
+    )
+
+
+async def aget_fundamentals_openai(ticker, curr_date):
+    return await _acached_openai_web_search(
+        "get_fundamentals_openai",
+        ticker,
+        curr_date,
+        _fundamentals_prompt(ticker, curr_date),
+    )
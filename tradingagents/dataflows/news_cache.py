@@ -0,0 +1,83 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import date, datetime
+from typing import Annotated, List, Optional
+
+from .config import get_config
+
+
+def normalize_news_date(value: Annotated[str, "yyyy-mm-dd or mm/dd/yyyy"]) -> str:
+    if "-" in value:
+        return datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d")
+    return datetime.strptime(value, "%m/%d/%Y").strftime("%Y-%m-%d")
+
+
+def normalize_news_query(query: Annotated[str, "search query"]) -> str:
+    """Case and whitespace insensitive form of a query; '+' counts as a space."""
+    return " ".join(query.replace("+", " ").lower().split())
+
+
+def news_cache_path(
+    query: Annotated[str, "search query"],
+    start_date: Annotated[str, "yyyy-mm-dd or mm/dd/yyyy"],
+    end_date: Annotated[str, "yyyy-mm-dd or mm/dd/yyyy"],
+    cache_dir: Annotated[Optional[str], "defaults to the configured data cache"] = None,
+) -> str:
+    cache_dir = cache_dir or get_config()["data_cache_dir"]
+    key = "|".join(
+        (
+            normalize_news_query(query),
+            normalize_news_date(start_date),
+            normalize_news_date(end_date),
+        )
+    )
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, "google_news", f"{digest}.json")
+
+
+def read_news_cache(
+    query: Annotated[str, "search query"],
+    start_date: Annotated[str, "yyyy-mm-dd or mm/dd/yyyy"],
+    end_date: Annotated[str, "yyyy-mm-dd or mm/dd/yyyy"],
+) -> Optional[List[dict]]:
+    """
+    Cached news records for the query and window, None on a miss. Windows
+    that ended before today never expire; windows reaching today or later
+    expire after google_news_cache_ttl_hours.
+    """
+    path = news_cache_path(query, start_date, end_date)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        entry = json.load(f)
+
+    if entry["end_date"] >= date.today().strftime("%Y-%m-%d"):
+        ttl = get_config()["google_news_cache_ttl_hours"] * 3600
+        if time.time() - entry["fetched_at"] > ttl:
+            return None
+    return entry["results"]
+
+
+def write_news_cache(
+    query: Annotated[str, "search query"],
+    start_date: Annotated[str, "yyyy-mm-dd or mm/dd/yyyy"],
+    end_date: Annotated[str, "yyyy-mm-dd or mm/dd/yyyy"],
+    results: Annotated[List[dict], "extracted news records"],
+) -> None:
+    path = news_cache_path(query, start_date, end_date)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    entry = {
+        "query": normalize_news_query(query),
+        "start_date": normalize_news_date(start_date),
+        "end_date": normalize_news_date(end_date),
+        "fetched_at": time.time(),
+        "results": results,
+    }
+    # write then rename, so concurrent readers never see a partial file
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(entry, f)
+    os.replace(tmp_path, path)
@@ -0,0 +1,90 @@
+import asyncio
+import os
+import threading
+import weakref
+from typing import Annotated, Dict, Optional, Tuple
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+from .config import get_config
+
+ClientKey = Tuple[str, Optional[str]]
+
+_clients: Dict[ClientKey, OpenAI] = {}
+# async clients hold connections bound to the loop that opened them, so
+# each event loop gets its own; they go away with the loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[ClientKey, AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+def _client_key(base_url: str, api_key: Optional[str]) -> ClientKey:
+    return base_url, api_key or os.environ.get("OPENAI_API_KEY")
+
+
+def _pool_settings() -> Tuple[httpx.Limits, httpx.Timeout]:
+    config = get_config()
+    limits = httpx.Limits(
+        max_connections=config["openai_max_connections"],
+        max_keepalive_connections=config["openai_max_keepalive_connections"],
+        keepalive_expiry=config["openai_keepalive_expiry"],
+    )
+    timeout = httpx.Timeout(
+        config["openai_timeout"], connect=config["openai_connect_timeout"]
+    )
+    return limits, timeout
+
+
+def get_openai_client(
+    base_url: Annotated[str, "API base url, e.g. config['backend_url']"],
+    api_key: Annotated[Optional[str], "defaults to OPENAI_API_KEY"] = None,
+) -> OpenAI:
+    """
+    Get the process-wide OpenAI client for base_url and api_key. Sharing it
+    keeps connections, TLS sessions and the connection pool alive across
+    requests instead of opening new ones per call.
+    """
+    key = _client_key(base_url, api_key)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            limits, timeout = _pool_settings()
+            client = _clients[key] = OpenAI(
+                base_url=base_url,
+                api_key=key[1],
+                timeout=timeout,
+                http_client=DefaultHttpxClient(limits=limits, timeout=timeout),
+            )
+    return client
+
+
+def get_async_openai_client(
+    base_url: Annotated[str, "API base url, e.g. config['backend_url']"],
+    api_key: Annotated[Optional[str], "defaults to OPENAI_API_KEY"] = None,
+) -> AsyncOpenAI:
+    """Get the shared AsyncOpenAI client for base_url and api_key on the running event loop."""
+    loop = asyncio.get_running_loop()
+    key = _client_key(base_url, api_key)
+    with _clients_lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            limits, timeout = _pool_settings()
+            client = clients[key] = AsyncOpenAI(
+                base_url=base_url,
+                api_key=key[1],
+                timeout=timeout,
+                http_client=DefaultAsyncHttpxClient(limits=limits, timeout=timeout),
+            )
+    return client
+
+
+async def aclose_async_openai_clients() -> None:
+    """Close the shared AsyncOpenAI clients of the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        clients = _async_clients.pop(loop, {})
+    for client in clients.values():
+        await client.close()
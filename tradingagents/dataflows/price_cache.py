@@ -0,0 +1,210 @@
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Annotated, Callable, Optional
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+
+try:
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:
+    feather = None
+    pq = None
+
+PRICE_CACHE_FORMATS = {"csv": ".csv", "feather": ".feather", "parquet": ".parquet"}
+
+
+def get_price_cache_format() -> str:
+    """
+    Resolve the on-disk format for downloaded price data from the config.
+    Binary formats need pyarrow; without it the cache falls back to csv.
+    """
+    fmt = get_config().get("price_cache_format", "csv").lower()
+    if fmt not in PRICE_CACHE_FORMATS:
+        raise ValueError(
+            f"Unsupported price cache format {fmt}. Please choose from: {list(PRICE_CACHE_FORMATS)}"
+        )
+    if fmt != "csv" and feather is None:
+        return "csv"
+    return fmt
+
+
+def price_cache_path(
+    base_path: Annotated[str, "cache file path without extension"],
+    fmt: Annotated[str, "csv, feather or parquet"],
+) -> str:
+    return base_path + PRICE_CACHE_FORMATS[fmt]
+
+
+def read_price_cache(
+    path: Annotated[str, "path of the cached price file"],
+    fmt: Annotated[str, "csv, feather or parquet"],
+) -> pd.DataFrame:
+    """Read cached price data with a datetime64 Date column."""
+    if fmt == "csv":
+        data = pd.read_csv(path)
+        data["Date"] = pd.to_datetime(data["Date"])
+        return data
+
+    # binary files keep Date as a native timestamp column and are memory-mapped
+    if fmt == "feather":
+        table = feather.read_table(path, memory_map=True)
+    else:
+        table = pq.read_table(path, memory_map=True)
+    return table.to_pandas()
+
+
+def write_price_cache(
+    data: Annotated[pd.DataFrame, "price data with a Date column"],
+    path: Annotated[str, "path of the cached price file"],
+    fmt: Annotated[str, "csv, feather or parquet"],
+) -> None:
+    data = data.reset_index(drop=True)
+    # write then rename, so concurrent readers (and mappings of the old file)
+    # never see a partial one
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    if fmt == "csv":
+        data.to_csv(tmp_path, index=False)
+    elif fmt == "feather":
+        # uncompressed so that reads can map the columns without decoding
+        data.to_feather(tmp_path, compression="uncompressed")
+    else:
+        data.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def export_price_cache_csv(
+    path: Annotated[str, "path of the cached price file"],
+    csv_path: Annotated[str, "where to write the csv export"],
+) -> None:
+    """Export a cached price file of any supported format to csv."""
+    fmt = next(
+        (f for f, ext in PRICE_CACHE_FORMATS.items() if path.endswith(ext)), None
+    )
+    if fmt is None:
+        raise ValueError(f"Unrecognized price cache file: {path}")
+    data = read_price_cache(path, fmt)
+    data.to_csv(csv_path, index=False)
+
+
+PriceFetcher = Callable[[str, str, str], pd.DataFrame]
+
+
+def yf_price_fetcher(
+    symbol: Annotated[str, "ticker symbol"],
+    start_date: Annotated[str, "first date to download, YYYY-mm-dd"],
+    end_date: Annotated[str, "download up to but excluding this date, YYYY-mm-dd"],
+) -> pd.DataFrame:
+    """Download daily bars from Yahoo Finance as a frame with a Date column."""
+    data = yf.download(
+        symbol,
+        start=start_date,
+        end=end_date,
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+    )
+    return data.reset_index()
+
+
+_price_fetcher: PriceFetcher = yf_price_fetcher
+
+
+def set_price_fetcher(fetcher: Optional[PriceFetcher]) -> None:
+    """Replace the fetcher used to fill the price cache, e.g. with a local stand-in. None restores Yahoo Finance."""
+    global _price_fetcher
+    _price_fetcher = fetcher or yf_price_fetcher
+
+
+# calendar days re-fetched before the cached end, so a few bars overlap
+PRICE_CACHE_OVERLAP_DAYS = 10
+
+
+def _tail_matches_cache(cached: pd.DataFrame, tail: pd.DataFrame) -> bool:
+    """
+    Whether the re-fetched overlap agrees with the cached bars. Adjusted
+    prices are restated after splits and dividends, so a mismatch means the
+    whole cached history is stale.
+    """
+    overlap = cached.merge(tail, on="Date", suffixes=("_cached", "_new"))
+    if overlap.empty:
+        # nothing to compare against if the cache has no bars there either
+        return not cached["Date"].between(tail["Date"].min(), tail["Date"].max()).any()
+    return bool(
+        np.allclose(
+            overlap["Close_cached"].to_numpy(dtype=float),
+            overlap["Close_new"].to_numpy(dtype=float),
+            rtol=1e-6,
+            equal_nan=True,
+        )
+    )
+
+
+def update_price_cache(
+    symbol: Annotated[str, "ticker symbol"],
+    cache_dir: Annotated[str, "directory holding the per-symbol price caches"],
+    start_date: Annotated[str, "first date that must be covered, YYYY-mm-dd"],
+    end_date: Annotated[str, "cover up to but excluding this date, YYYY-mm-dd"],
+    fmt: Annotated[str, "csv, feather or parquet"],
+    fetcher: Annotated[
+        Optional[PriceFetcher], "downloads missing bars, defaults to Yahoo Finance"
+    ] = None,
+) -> pd.DataFrame:
+    """
+    Keep one price cache per symbol and extend it instead of re-downloading.
+    A sidecar json records the covered [start, end) range; only the missing
+    tail is fetched and appended. The tail starts a few bars before the
+    cached end, and if the overlapping closes differ (the back history was
+    re-adjusted) the whole range is downloaded again and the cache rewritten.
+    Returns the bars in [start_date, end_date).
+    """
+    fetcher = fetcher or _price_fetcher
+    base_path = os.path.join(cache_dir, f"{symbol}-YFin-data")
+    data_file = price_cache_path(base_path, fmt)
+    meta_file = base_path + ".json"
+
+    meta = None
+    if os.path.exists(data_file) and os.path.exists(meta_file):
+        with open(meta_file, "r") as f:
+            meta = json.load(f)
+        if meta.get("format") != fmt or meta["start"] > start_date:
+            meta = None
+
+    if meta is None:
+        data = fetcher(symbol, start_date, end_date)
+        data["Date"] = pd.to_datetime(data["Date"])
+        meta = {"start": start_date, "end": end_date, "format": fmt}
+        write_price_cache(data, data_file, fmt)
+    else:
+        data = read_price_cache(data_file, fmt)
+        if meta["end"] < end_date:
+            overlap_start = datetime.strptime(meta["end"], "%Y-%m-%d") - timedelta(
+                days=PRICE_CACHE_OVERLAP_DAYS
+            )
+            tail = fetcher(symbol, overlap_start.strftime("%Y-%m-%d"), end_date)
+            if not tail.empty:
+                tail["Date"] = pd.to_datetime(tail["Date"])
+                if _tail_matches_cache(data[["Date", "Close"]], tail[["Date", "Close"]]):
+                    data = pd.concat([data, tail], ignore_index=True)
+                    data = data.drop_duplicates(subset="Date", keep="last")
+                    data = data.sort_values("Date", kind="stable")
+                else:
+                    data = fetcher(symbol, meta["start"], end_date)
+                    data["Date"] = pd.to_datetime(data["Date"])
+                write_price_cache(data, data_file, fmt)
+            meta["end"] = end_date
+
+    # the range is recorded only once the data file covering it is in place
+    tmp_meta_file = f"{meta_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_meta_file, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp_meta_file, meta_file)
+
+    in_range = (data["Date"] >= start_date) & (data["Date"] < end_date)
+    return data.loc[in_range].reset_index(drop=True)
@@ -0,0 +1,159 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Annotated, Callable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+from .trading_calendar import TradingCalendar
+
+PriceKey = Tuple[str, str, str, str]
+
+
+class _PriceEntry:
+    """A parsed price history together with the trading calendar of its dates."""
+
+    def __init__(self, frame: pd.DataFrame):
+        dates = frame["Date"].astype(str).str[:10].to_numpy()
+        if len(dates) > 1 and not (dates[1:] >= dates[:-1]).all():
+            order = np.argsort(dates, kind="stable")
+            frame = frame.iloc[order]
+            dates = dates[order]
+
+        self.frame = frame
+        self.calendar = TradingCalendar(dates, assume_sorted=True)
+        self.nbytes = int(frame.memory_usage(deep=True).sum())
+
+    def slice(self, start_date: Optional[str], end_date: Optional[str]) -> pd.DataFrame:
+        return self.frame.iloc[self.calendar.index_range(start_date, end_date)].copy()
+
+
+class PriceStore:
+    """
+    Process-wide cache of parsed price histories.
+
+    Each history is keyed by (symbol, source, start, end), where start/end is
+    the date range of the underlying file. A history is parsed once by the
+    loader passed on first access and then served from memory; callers always
+    receive their own copy of the requested rows, so the resident frame is
+    never mutated. Least recently used histories are evicted once the total
+    footprint exceeds ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[PriceKey, _PriceEntry]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __contains__(self, key: PriceKey) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _lookup(self, key: PriceKey) -> Optional[_PriceEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _insert(self, key: PriceKey, entry: _PriceEntry) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= old.nbytes
+            self._entries[key] = entry
+            self._nbytes += entry.nbytes
+            # always keep the newest entry, even if it alone exceeds the budget
+            while self._nbytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+
+    def _get_entry(
+        self, key: PriceKey, loader: Callable[[], pd.DataFrame]
+    ) -> _PriceEntry:
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # only one thread parses a given file; the others wait and reuse it
+        with key_lock:
+            entry = self._lookup(key)
+            if entry is None:
+                entry = _PriceEntry(loader())
+                self._insert(key, entry)
+
+        with self._lock:
+            self._key_locks.pop(key, None)
+        return entry
+
+    def get(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        source: Annotated[str, "where the history comes from, e.g. offline/online"],
+        start: Annotated[str, "first date covered by the underlying file"],
+        end: Annotated[str, "last date covered by the underlying file"],
+        loader: Annotated[
+            Callable[[], pd.DataFrame], "parses the history on a cache miss"
+        ],
+        start_date: Annotated[Optional[str], "first date to return, YYYY-mm-dd"] = None,
+        end_date: Annotated[Optional[str], "last date to return, YYYY-mm-dd"] = None,
+    ) -> pd.DataFrame:
+        """Return the rows of a cached history between start_date and end_date (inclusive)."""
+        entry = self._get_entry((symbol, source, start, end), loader)
+        return entry.slice(start_date, end_date)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+
+_price_store: Optional[PriceStore] = None
+_price_store_lock = threading.Lock()
+
+
+def get_price_store() -> PriceStore:
+    """Get the process-wide price store, sized from the current config."""
+    global _price_store
+    max_bytes = int(get_config()["price_store_max_mb"] * 1024 * 1024)
+    with _price_store_lock:
+        if _price_store is None:
+            _price_store = PriceStore(max_bytes)
+        else:
+            _price_store.max_bytes = max_bytes
+    return _price_store
+
+
+def get_offline_price_data(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    price_dir: Annotated[str, "directory holding the offline YFin csv files"],
+    start_date: Annotated[Optional[str], "first date to return, YYYY-mm-dd"] = None,
+    end_date: Annotated[Optional[str], "last date to return, YYYY-mm-dd"] = None,
+) -> pd.DataFrame:
+    """Read rows of the offline {symbol}-YFin-data csv through the shared price store."""
+    return get_price_store().get(
+        symbol,
+        "offline",
+        "2015-01-01",
+        "2025-03-25",
+        lambda: pd.read_csv(
+            os.path.join(price_dir, f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv")
+        ),
+        start_date,
+        end_date,
+    )
@@ -0,0 +1,204 @@
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Annotated, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .config import get_config
+from .derived_files import open_or_build
+
+
+class RedditDayIndex:
+    """
+    Posts of one subreddit file partitioned by UTC date.
+
+    The partitions live in a jsonl file, one post per line, ordered by date
+    and then by upvotes (descending, ties in original file order). A
+    structured array of (date, byte range) locates each day, so reading a
+    day only touches that day's lines.
+    """
+
+    def __init__(self, path: str, index: np.ndarray):
+        self.path = path
+        self.index = index
+
+    def get_day(self, date: Annotated[str, "UTC date, YYYY-mm-dd"]) -> List[dict]:
+        """Posts of date, most upvoted first."""
+        return self.get_range(date, date).get(date, [])
+
+    def iter_range(
+        self,
+        start_date: Annotated[str, "first UTC date, YYYY-mm-dd"],
+        end_date: Annotated[str, "last UTC date, YYYY-mm-dd"],
+    ) -> Iterator[Tuple[str, Iterator[dict]]]:
+        """
+        (date, posts) for every date in [start_date, end_date] that has any,
+        most upvoted first. The days are adjacent in the file, so the whole
+        window is one read; posts are only decoded as they are consumed, so
+        a caller taking the top k never parses the rest of the day.
+        """
+        lo = np.searchsorted(self.index["date"], start_date, "left")
+        hi = np.searchsorted(self.index["date"], end_date, "right")
+        if lo == hi:
+            return
+        offset = int(self.index["start"][lo])
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            buf = f.read(int(self.index["end"][hi - 1]) - offset)
+
+        for date, start, end in self.index[lo:hi]:
+            lines = buf[start - offset : end - offset].splitlines()
+            yield str(date), map(json.loads, lines)
+
+    def get_range(
+        self,
+        start_date: Annotated[str, "first UTC date, YYYY-mm-dd"],
+        end_date: Annotated[str, "last UTC date, YYYY-mm-dd"],
+    ) -> Dict[str, List[dict]]:
+        """Posts of every date in [start_date, end_date] that has any, most upvoted first."""
+        return {
+            date: list(posts) for date, posts in self.iter_range(start_date, end_date)
+        }
+
+    @staticmethod
+    def build(
+        source: Annotated[str, "path of the subreddit .jsonl file"],
+        base_path: Annotated[str, "partition file path without extension"],
+    ) -> None:
+        """Parse source once and write the .jsonl partitions and .idx.npy index."""
+        posts = []
+        with open(source, "rb") as f:
+            for line in f:
+                # skip empty lines
+                if not line.strip():
+                    continue
+
+                parsed_line = json.loads(line)
+                posts.append(
+                    {
+                        "title": parsed_line["title"],
+                        "content": parsed_line["selftext"],
+                        "url": parsed_line["url"],
+                        "upvotes": parsed_line["ups"],
+                        "posted_date": datetime.utcfromtimestamp(
+                            parsed_line["created_utc"]
+                        ).strftime("%Y-%m-%d"),
+                    }
+                )
+
+        # stable, so equally upvoted posts keep their order in the file
+        posts.sort(key=lambda post: (post["posted_date"], -post["upvotes"]))
+
+        entries, offset = [], 0
+        with open(base_path + ".jsonl", "wb") as out:
+            for post in posts:
+                line = json.dumps(post).encode("utf-8") + b"\n"
+                out.write(line)
+                if entries and entries[-1][0] == post["posted_date"]:
+                    entries[-1][2] += len(line)
+                else:
+                    entries.append([post["posted_date"], offset, offset + len(line)])
+                offset += len(line)
+
+        index = np.array(
+            [tuple(entry) for entry in entries],
+            dtype=[("date", "U10"), ("start", "i8"), ("end", "i8")],
+        )
+        np.save(base_path + ".idx.npy", index)
+
+    @classmethod
+    def open(
+        cls, base_path: Annotated[str, "partition file path without extension"]
+    ) -> "RedditDayIndex":
+        return cls(base_path + ".jsonl", np.load(base_path + ".idx.npy"))
+
+
+class RedditStore:
+    """
+    Day-partitioned copies of the Reddit subreddit dumps, built the first
+    time a file is read and kept under the cache directory. Updated dumps
+    are re-ingested.
+    """
+
+    def __init__(self, cache_dir: Annotated[str, "where the partitions are kept"]):
+        self.cache_dir = cache_dir
+        self._indexes: Dict[str, RedditDayIndex] = {}
+        self._lock = threading.Lock()
+
+    def _open(self, source: str) -> RedditDayIndex:
+        category = os.path.basename(os.path.dirname(source))
+        name = os.path.splitext(os.path.basename(source))[0]
+        base_path = os.path.join(self.cache_dir, "reddit", category, name)
+        return open_or_build(
+            source,
+            base_path,
+            (".jsonl", ".idx.npy"),
+            RedditDayIndex.build,
+            RedditDayIndex.open,
+        )
+
+    def get_index(
+        self, source: Annotated[str, "path of the subreddit .jsonl file"]
+    ) -> RedditDayIndex:
+        # held while ingesting so a dump is only parsed once
+        with self._lock:
+            index = self._indexes.get(source)
+            if index is None:
+                index = self._indexes[source] = self._open(source)
+        return index
+
+    def get_day(
+        self,
+        source: Annotated[str, "path of the subreddit .jsonl file"],
+        date: Annotated[str, "UTC date, YYYY-mm-dd"],
+    ) -> List[dict]:
+        """Posts of source on date, most upvoted first."""
+        return self.get_index(source).get_day(date)
+
+    def get_range(
+        self,
+        source: Annotated[str, "path of the subreddit .jsonl file"],
+        start_date: Annotated[str, "first UTC date, YYYY-mm-dd"],
+        end_date: Annotated[str, "last UTC date, YYYY-mm-dd"],
+    ) -> Dict[str, List[dict]]:
+        """Posts of source per date in [start_date, end_date], most upvoted first."""
+        return self.get_index(source).get_range(start_date, end_date)
+
+    def iter_range(
+        self,
+        source: Annotated[str, "path of the subreddit .jsonl file"],
+        start_date: Annotated[str, "first UTC date, YYYY-mm-dd"],
+        end_date: Annotated[str, "last UTC date, YYYY-mm-dd"],
+    ) -> Iterator[Tuple[str, Iterator[dict]]]:
+        """Lazily decoded posts of source per date in [start_date, end_date], most upvoted first."""
+        return self.get_index(source).iter_range(start_date, end_date)
+
+    def ingest(
+        self, data_path: Annotated[str, "reddit data folder with one dir per category"]
+    ) -> None:
+        """Build the partitions of every subreddit file up front."""
+        for category in sorted(os.listdir(data_path)):
+            category_dir = os.path.join(data_path, category)
+            if not os.path.isdir(category_dir):
+                continue
+            for data_file in sorted(os.listdir(category_dir)):
+                if data_file.endswith(".jsonl"):
+                    self.get_index(os.path.join(category_dir, data_file))
+
+
+_reddit_stores: Dict[str, RedditStore] = {}
+_reddit_stores_lock = threading.Lock()
+
+
+def get_reddit_store(
+    cache_dir: Annotated[Optional[str], "defaults to the configured data cache"] = None,
+) -> RedditStore:
+    """Get the process-wide Reddit store for cache_dir."""
+    cache_dir = cache_dir or get_config()["data_cache_dir"]
+    with _reddit_stores_lock:
+        store = _reddit_stores.get(cache_dir)
+        if store is None:
+            store = _reddit_stores[cache_dir] = RedditStore(cache_dir)
+    return store
@@ -3,10 +3,14 @@ import time
 import json
 from datetime import datetime, timedelta
 from contextlib import contextmanager
-from typing import Annotated
+from functools import lru_cache
+from itertools import islice
+from typing import Annotated, Dict, Iterable, List, Set, Tuple
 import os
 import re
 
+from .reddit_store import get_reddit_store
+
 ticker_to_company = {
     "AAPL": "Apple",
     "MSFT": "Microsoft",
@@ -49,6 +53,71 @@ ticker_to_company = {
 }
 
 
+
+def ticker_search_terms(
+    ticker: Annotated[str, "ticker symbol in ticker_to_company"]
+) -> List[str]:
+    """The company names and the ticker itself to look for in posts."""
+    search_terms = [term.strip() for term in ticker_to_company[ticker].split(" OR ")]
+    search_terms.append(ticker)
+    return search_terms
+
+
+def search_term_pattern(term: Annotated[str, "company name or ticker"]) -> str:
+    """
+    Regex for a literal search term as a whole word. Terms written in
+    capitals (tickers, acronyms such as TSMC) must match case-sensitively,
+    company names in any case.
+    """
+    pattern = rf"(?<!\w){re.escape(term)}(?!\w)"
+    return pattern if term.isupper() else f"(?i:{pattern})"
+
+
+@lru_cache(maxsize=None)
+def get_ticker_matcher(
+    ticker: Annotated[str, "ticker symbol in ticker_to_company"]
+) -> re.Pattern:
+    """One compiled alternation of the search terms of ticker."""
+    return re.compile(
+        "|".join(search_term_pattern(term) for term in ticker_search_terms(ticker))
+    )
+
+
+class CompanyTagger:
+    """
+    Tags text with every ticker whose search terms it mentions.
+
+    A single alternation over the terms of all tickers finds each position
+    where some term starts; only there are the per-ticker matchers tried, so
+    one scan of a post tags it for every company it mentions.
+    """
+
+    def __init__(
+        self, tickers: Annotated[Iterable[str], "tickers in ticker_to_company"]
+    ):
+        self.matchers = {ticker: get_ticker_matcher(ticker) for ticker in tickers}
+        self.pattern = re.compile(
+            "|".join(f"(?:{matcher.pattern})" for matcher in self.matchers.values())
+        )
+
+    def tag(self, *texts: str) -> Set[str]:
+        tags = set()
+        for text in texts:
+            match = self.pattern.search(text)
+            while match is not None and len(tags) < len(self.matchers):
+                pos = match.start()
+                for ticker, matcher in self.matchers.items():
+                    if ticker not in tags and matcher.match(text, pos):
+                        tags.add(ticker)
+                match = self.pattern.search(text, pos + 1)
+        return tags
+
+
+@lru_cache(maxsize=None)
+def get_company_tagger(tickers: Tuple[str, ...]) -> CompanyTagger:
+    return CompanyTagger(tickers)
+
+
 def fetch_top_from_category(
     category: Annotated[
         str, "Category to fetch top post from. Collection of subreddits."
@@ -61,75 +130,108 @@ def fetch_top_from_category(
         "Path to the data folder. Default is 'reddit_data'.",
     ] = "reddit_data",
 ):
-    base_path = data_path
+    return fetch_top_from_category_window(
+        category, date, date, max_limit, query, data_path=data_path
+    )
 
-    all_content = []
 
-    if max_limit < len(os.listdir(os.path.join(base_path, category))):
+def fetch_top_from_category_for_tickers(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    date: Annotated[str, "Date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per ticker."],
+    tickers: Annotated[List[str], "tickers to search for in the subreddit."],
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+) -> Dict[str, List[dict]]:
+    """
+    fetch_top_from_category for many tickers at once: every post of the day
+    is tagged in one pass and routed to each company it mentions. Returns
+    the same posts per ticker as separate calls with query=ticker would.
+    """
+    base_path = data_path
+    data_files = os.listdir(os.path.join(base_path, category))
+
+    if max_limit < len(data_files):
         raise ValueError(
             "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
         )
 
-    limit_per_subreddit = max_limit // len(
-        os.listdir(os.path.join(base_path, category))
-    )
+    limit_per_subreddit = max_limit // len(data_files)
+    tagger = get_company_tagger(tuple(tickers))
 
-    for data_file in os.listdir(os.path.join(base_path, category)):
+    all_content = {ticker: [] for ticker in tickers}
+    for data_file in data_files:
         # check if data_file is a .jsonl file
         if not data_file.endswith(".jsonl"):
             continue
 
-        all_content_curr_subreddit = []
-
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
-
-                parsed_line = json.loads(line)
-
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
-                    continue
-
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
+        counts = dict.fromkeys(tickers, 0)
+        for post in get_reddit_store().get_day(
+            os.path.join(base_path, category, data_file), date
+        ):
+            for ticker in tagger.tag(post["title"], post["content"]):
+                if counts[ticker] < limit_per_subreddit:
+                    all_content[ticker].append(post)
+                    counts[ticker] += 1
 
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
+    return all_content
 
-                    if not found:
-                        continue
 
-                post = {
-                    "title": parsed_line["title"],
-                    "content": parsed_line["selftext"],
-                    "url": parsed_line["url"],
-                    "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
-                }
+def fetch_top_from_category_window(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    start_date: Annotated[str, "First date to fetch top posts from."],
+    end_date: Annotated[str, "Last date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+) -> List[dict]:
+    """
+    fetch_top_from_category over every day in [start_date, end_date]. Each
+    subreddit file is read once for the whole window and its posts bucketed
+    by date; the day partitions are already sorted by upvotes, so the per-day
+    top-k is the first limit_per_subreddit matches and posts past them are
+    never decoded. Returns the posts day by day, in the same order as one
+    call per day would.
+    """
+    base_path = data_path
+    data_files = os.listdir(os.path.join(base_path, category))
 
-                all_content_curr_subreddit.append(post)
+    if max_limit < len(data_files):
+        raise ValueError(
+            "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
+        )
 
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
+    limit_per_subreddit = max_limit // len(data_files)
+    matcher = get_ticker_matcher(query) if "company" in category and query else None
 
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
+    # date -> top posts of each subreddit file, in listdir order
+    top_posts: Dict[str, List[dict]] = {}
+    for data_file in data_files:
+        # check if data_file is a .jsonl file
+        if not data_file.endswith(".jsonl"):
+            continue
 
-    return all_content
+        days = get_reddit_store().iter_range(
+            os.path.join(base_path, category, data_file), start_date, end_date
+        )
+        for date, posts in days:
+            if matcher is not None:
+                posts = (
+                    post
+                    for post in posts
+                    if matcher.search(post["title"]) or matcher.search(post["content"])
+                )
+            top_posts.setdefault(date, []).extend(
+                islice(posts, limit_per_subreddit)
+            )
+
+    return [post for date in sorted(top_posts) for post in top_posts[date]]
@@ -0,0 +1,137 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+from datetime import date
+from typing import Annotated, Awaitable, Callable, Dict, Optional, Tuple
+
+from .config import get_config
+
+ResponseKey = Tuple[str, str, str, str]
+
+
+class ResponseCache:
+    """
+    Persistent cache of text responses keyed by (function, ticker, date,
+    model), with de-duplication of in-flight requests: concurrent callers
+    asking for the same key wait for the first caller's request instead of
+    issuing their own. Responses for dates before today never expire; those
+    for today or later expire after openai_cache_ttl_hours. Failed requests
+    are not cached.
+    """
+
+    def __init__(self, cache_dir: Annotated[str, "where the responses are kept"]):
+        self.cache_dir = cache_dir
+        self._in_flight: Dict[ResponseKey, Future] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, key: ResponseKey) -> str:
+        digest = hashlib.sha1("|".join(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, "openai_responses", f"{digest}.json")
+
+    def _read(self, key: ResponseKey) -> Optional[str]:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r") as f:
+            entry = json.load(f)
+        if entry["key"] != list(key):
+            return None
+
+        if key[2] >= date.today().strftime("%Y-%m-%d"):
+            ttl = get_config()["openai_cache_ttl_hours"] * 3600
+            if time.time() - entry["created_at"] > ttl:
+                return None
+        return entry["response"]
+
+    def _write(self, key: ResponseKey, response: str) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entry = {"key": list(key), "created_at": time.time(), "response": response}
+        # write then rename, so concurrent readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    def _claim(self, key: ResponseKey) -> Tuple[Future, bool]:
+        """The in-flight future of key, and whether the caller must resolve it."""
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                return future, False
+            future = self._in_flight[key] = Future()
+            return future, True
+
+    def _release(self, key: ResponseKey) -> None:
+        with self._lock:
+            del self._in_flight[key]
+
+    def get_or_compute(
+        self,
+        key: Annotated[ResponseKey, "(function, ticker, date, model)"],
+        compute: Annotated[Callable[[], str], "issues the request on a miss"],
+    ) -> str:
+        future, owner = self._claim(key)
+        if not owner:
+            return future.result()
+
+        try:
+            response = self._read(key)
+            if response is None:
+                response = compute()
+                self._write(key, response)
+            future.set_result(response)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._release(key)
+        return response
+
+    async def aget_or_compute(
+        self,
+        key: Annotated[ResponseKey, "(function, ticker, date, model)"],
+        compute: Annotated[
+            Callable[[], Awaitable[str]], "issues the request on a miss"
+        ],
+    ) -> str:
+        """
+        Async version of get_or_compute. It shares in-flight requests with
+        sync callers and with other event loops.
+        """
+        future, owner = self._claim(key)
+        if not owner:
+            return await asyncio.wrap_future(future)
+
+        try:
+            response = self._read(key)
+            if response is None:
+                response = await compute()
+                self._write(key, response)
+            future.set_result(response)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._release(key)
+        return response
+
+
+_response_caches: Dict[str, ResponseCache] = {}
+_response_caches_lock = threading.Lock()
+
+
+def get_response_cache(
+    cache_dir: Annotated[Optional[str], "defaults to the configured data cache"] = None,
+) -> ResponseCache:
+    """Get the process-wide response cache for cache_dir."""
+    cache_dir = cache_dir or get_config()["data_cache_dir"]
+    with _response_caches_lock:
+        cache = _response_caches.get(cache_dir)
+        if cache is None:
+            cache = _response_caches[cache_dir] = ResponseCache(cache_dir)
+    return cache
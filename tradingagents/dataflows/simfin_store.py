@@ -0,0 +1,208 @@
+import os
+import threading
+from typing import Annotated, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+from .derived_files import open_or_build
+from .price_cache import get_price_cache_format, read_price_cache, write_price_cache
+
+# statement -> (directory under simfin_data_all, file name infix)
+SIMFIN_STATEMENTS = {
+    "balance_sheet": ("balance_sheet", "balance"),
+    "cash_flow": ("cash_flow", "cashflow"),
+    "income_statements": ("income_statements", "income"),
+}
+
+
+def simfin_statement_path(
+    data_dir: Annotated[str, "root of the offline data"],
+    statement: Annotated[str, "one of SIMFIN_STATEMENTS"],
+    freq: Annotated[str, "annual / quarterly"],
+) -> str:
+    directory, infix = SIMFIN_STATEMENTS[statement]
+    return os.path.join(
+        data_dir,
+        "fundamental_data",
+        "simfin_data_all",
+        directory,
+        "companies",
+        "us",
+        f"us-{infix}-{freq}.csv",
+    )
+
+
+def parse_simfin_statement(path: Annotated[str, "path of a SimFin csv"]) -> pd.DataFrame:
+    """Read a SimFin statement csv with normalized UTC report and publish dates."""
+    df = pd.read_csv(path, sep=";")
+    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+    return df
+
+
+class SimFinTable:
+    """
+    One SimFin statement file sorted by (Ticker, Publish Date). Each ticker
+    owns a contiguous block of rows, so the latest report published on or
+    before a date is a dictionary lookup followed by a binary search.
+    The original csv row numbers are kept as the index.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        frame = frame[frame["Publish Date"].notna()]
+        frame = frame.sort_values(["Ticker", "Publish Date"], kind="stable")
+        self.frame = frame
+        self.publish_dates = frame["Publish Date"].to_numpy(dtype="datetime64[ns]")
+
+        tickers = frame["Ticker"].to_numpy()
+        self._blocks: Dict[str, Tuple[int, int]] = {}
+        if len(tickers):
+            starts = np.flatnonzero(np.r_[True, tickers[1:] != tickers[:-1]])
+            ends = np.r_[starts[1:], len(tickers)]
+            for lo, hi in zip(starts, ends):
+                self._blocks[tickers[lo]] = (int(lo), int(hi))
+
+    def as_of(
+        self,
+        ticker: Annotated[str, "ticker symbol"],
+        dates: Annotated[List[str], "as-of dates, yyyy-mm-dd"],
+    ) -> np.ndarray:
+        """
+        Row positions of the most recent report of ticker published on or
+        before each date, -1 where there is none. All dates are resolved with
+        one vectorized as-of search over the ticker's block.
+        """
+        positions = np.full(len(dates), -1)
+        block = self._blocks.get(ticker)
+        if block is None or len(dates) == 0:
+            return positions
+        lo, hi = block
+
+        as_of_dates = pd.to_datetime(list(dates), utc=True).normalize()
+        as_of_dates = as_of_dates.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+        block_dates = self.publish_dates[lo:hi]
+        i = np.searchsorted(block_dates, as_of_dates, "right")
+        found = i > 0
+        # first of several reports published on the same day, as idxmax would pick
+        first = np.searchsorted(block_dates, block_dates[i[found] - 1], "left")
+        positions[found] = lo + first
+        return positions
+
+    def latest(
+        self,
+        ticker: Annotated[str, "ticker symbol"],
+        curr_date: Annotated[str, "as-of date, yyyy-mm-dd"],
+    ) -> Optional[pd.Series]:
+        """The most recent report of ticker published on or before curr_date."""
+        position = self.as_of(ticker, [curr_date])[0]
+        return None if position < 0 else self.frame.iloc[position]
+
+
+class SimFinStore:
+    """
+    Parses each SimFin statement file once per process. Parsed tables are
+    also persisted to the binary price cache format, so later processes skip
+    the csv parse until the source file changes.
+    """
+
+    def __init__(
+        self,
+        data_dir: Annotated[str, "root of the offline data"],
+        cache_dir: Annotated[Optional[str], "where to persist parsed tables"] = None,
+        fmt: Annotated[str, "csv, feather or parquet"] = "feather",
+    ):
+        self.data_dir = data_dir
+        # csv would only trade one parse for another, so it is never persisted
+        self.cache_dir = cache_dir if fmt != "csv" else None
+        self.fmt = fmt
+        self._tables: Dict[Tuple[str, str], SimFinTable] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, statement: str, freq: str) -> pd.DataFrame:
+        source = simfin_statement_path(self.data_dir, statement, freq)
+        if self.cache_dir is None:
+            return parse_simfin_statement(source)
+
+        suffix = ".feather" if self.fmt == "feather" else ".parquet"
+
+        def build(source: str, base_path: str) -> None:
+            df = parse_simfin_statement(source)
+            write_price_cache(
+                df.rename_axis("Row").reset_index(), base_path + suffix, self.fmt
+            )
+
+        def load(base_path: str) -> pd.DataFrame:
+            df = read_price_cache(base_path + suffix, self.fmt)
+            return df.set_index("Row").rename_axis(None)
+
+        base_path = os.path.join(self.cache_dir, f"simfin-{statement}-{freq}")
+        return open_or_build(source, base_path, (suffix,), build, load)
+
+    def get_table(
+        self,
+        statement: Annotated[str, "one of SIMFIN_STATEMENTS"],
+        freq: Annotated[str, "annual / quarterly"],
+    ) -> SimFinTable:
+        if statement not in SIMFIN_STATEMENTS:
+            raise ValueError(
+                f"SimFin statement {statement} is not supported. Please choose from: {list(SIMFIN_STATEMENTS)}"
+            )
+        key = (statement, freq)
+        # held while loading so a statement file is only parsed once
+        with self._lock:
+            table = self._tables.get(key)
+            if table is None:
+                table = self._tables[key] = SimFinTable(self._load(statement, freq))
+        return table
+
+    def latest_report(
+        self,
+        ticker: Annotated[str, "ticker symbol"],
+        statement: Annotated[str, "one of SIMFIN_STATEMENTS"],
+        freq: Annotated[str, "annual / quarterly"],
+        curr_date: Annotated[str, "as-of date, yyyy-mm-dd"],
+    ) -> Optional[pd.Series]:
+        """The latest report of ticker published on or before curr_date, None if there is none."""
+        return self.get_table(statement, freq).latest(ticker, curr_date)
+
+    def reports_as_of(
+        self,
+        ticker: Annotated[str, "ticker symbol"],
+        statement: Annotated[str, "one of SIMFIN_STATEMENTS"],
+        freq: Annotated[str, "annual / quarterly"],
+        dates: Annotated[List[str], "as-of dates, yyyy-mm-dd"],
+    ) -> List[Optional[pd.Series]]:
+        """
+        Point-in-time reports of ticker, one per date: the latest report
+        published on or before that date, or None. Dates sharing a report get
+        the same Series object.
+        """
+        table = self.get_table(statement, freq)
+        rows: Dict[int, pd.Series] = {}
+        reports = []
+        for position in table.as_of(ticker, dates):
+            if position < 0:
+                reports.append(None)
+                continue
+            if position not in rows:
+                rows[position] = table.frame.iloc[position]
+            reports.append(rows[position])
+        return reports
+
+
+_simfin_stores: Dict[Tuple[str, str, str], SimFinStore] = {}
+_simfin_stores_lock = threading.Lock()
+
+
+def get_simfin_store(
+    data_dir: Annotated[str, "root of the offline data"],
+) -> SimFinStore:
+    """Get the process-wide SimFin store for data_dir and the configured cache."""
+    key = (data_dir, get_config()["data_cache_dir"], get_price_cache_format())
+    with _simfin_stores_lock:
+        store = _simfin_stores.get(key)
+        if store is None:
+            store = _simfin_stores[key] = SimFinStore(*key)
+    return store
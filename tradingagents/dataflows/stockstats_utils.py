@@ -1,12 +1,194 @@
 import pandas as pd
-import yfinance as yf
 from stockstats import wrap
-from typing import Annotated
+from typing import Annotated, List
 import os
 from .config import get_config
+from .price_store import get_price_store, get_offline_price_data
+from .price_cache import get_price_cache_format, update_price_cache
+from .indicator_engine import (
+    IndicatorMatrix,
+    SUPPORTED_INDICATORS,
+    compute_indicator_panel,
+    get_indicator_engine,
+)
 
 
 class StockstatsUtils:
+    @staticmethod
+    def get_online_date_range():
+        """The 15-year [start, end) range of price history used in online mode."""
+        # Get today's date as YYYY-mm-dd to add to cache
+        today_date = pd.Timestamp.today()
+
+        end_date = today_date
+        start_date = today_date - pd.DateOffset(years=15)
+        start_date = start_date.strftime("%Y-%m-%d")
+        end_date = end_date.strftime("%Y-%m-%d")
+        return start_date, end_date
+
+    @staticmethod
+    def get_price_data(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.DataFrame:
+        """Load the raw price history used for indicator computation."""
+        if not online:
+            try:
+                data = get_offline_price_data(symbol, data_dir)
+            except FileNotFoundError:
+                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+            data["Date"] = data["Date"].astype(str).str[:10]
+            return data
+
+        start_date, end_date = StockstatsUtils.get_online_date_range()
+
+        # Get config and ensure cache directory exists
+        config = get_config()
+        os.makedirs(config["data_cache_dir"], exist_ok=True)
+
+        cache_format = get_price_cache_format()
+
+        def load_data():
+            return update_price_cache(
+                symbol, config["data_cache_dir"], start_date, end_date, cache_format
+            )
+
+        data = get_price_store().get(
+            symbol, "online", start_date, end_date, load_data
+        )
+        data["Date"] = data["Date"].dt.strftime("%Y-%m-%d")
+        return data
+
+    @staticmethod
+    def get_indicator_matrix(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> IndicatorMatrix:
+        """Get the precomputed date x indicator matrix of all SUPPORTED_INDICATORS."""
+        if online:
+            source = "online"
+            version = "-".join(StockstatsUtils.get_online_date_range())
+        else:
+            source = "offline"
+            version = "2015-01-01-2025-03-25"
+
+        return get_indicator_engine().get_matrix(
+            symbol,
+            source,
+            version,
+            lambda: StockstatsUtils.get_price_data(symbol, data_dir, online),
+        )
+
+    @staticmethod
+    def get_stock_stats_range(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        start_date: Annotated[str, "start date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "end date of the window, YYYY-mm-dd"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.Series:
+        """
+        Compute an indicator once over the full history and return its values
+        for the trading days in [start_date, end_date], indexed by YYYY-mm-dd.
+        """
+        if indicator in SUPPORTED_INDICATORS:
+            matrix = StockstatsUtils.get_indicator_matrix(symbol, data_dir, online)
+            return matrix.window(indicator, start_date, end_date)
+
+        df = wrap(StockstatsUtils.get_price_data(symbol, data_dir, online))
+        df[indicator]  # trigger stockstats to calculate the indicator
+
+        in_range = (df["Date"] >= start_date) & (df["Date"] <= end_date)
+        window = df.loc[in_range, ["Date", indicator]]
+        return pd.Series(window[indicator].values, index=window["Date"].values)
+
+    @staticmethod
+    def get_stock_stats_panel(
+        symbols: Annotated[List[str], "ticker symbols of the companies"],
+        indicators: Annotated[
+            List[str], "quantitative indicators based off of the stock data"
+        ],
+        start_date: Annotated[str, "start date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "end date of the window, YYYY-mm-dd"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.DataFrame:
+        """
+        Compute indicators for many symbols. Returns a tidy frame with Symbol,
+        Date, Indicator and Value columns; symbols whose price data cannot be
+        loaded are reported and left out.
+
+        With the numpy indicator_backend every indicator is computed across
+        all symbols in one vectorized pass; the values agree with the
+        per-symbol reports of get_stock_stats_range up to floating-point
+        rounding in the last digits. With stockstats the panel kernels would
+        not match it, so the values are read from the per-symbol indicator
+        matrices instead.
+        """
+        if get_config()["indicator_backend"] != "numpy":
+            windows = []
+            for symbol in symbols:
+                try:
+                    matrix = StockstatsUtils.get_indicator_matrix(
+                        symbol, data_dir, online
+                    )
+                except Exception as e:
+                    print(f"Error loading price data for {symbol}: {e}")
+                    continue
+                for indicator in indicators:
+                    window = matrix.window(indicator, start_date, end_date)
+                    windows.append(
+                        pd.DataFrame(
+                            {
+                                "Symbol": symbol,
+                                "Date": window.index,
+                                "Indicator": indicator,
+                                "Value": window.values,
+                            }
+                        )
+                    )
+            if not windows:
+                return pd.DataFrame(columns=["Symbol", "Date", "Indicator", "Value"])
+            return pd.concat(windows, ignore_index=True)
+
+        prices = {}
+        for symbol in symbols:
+            try:
+                prices[symbol] = StockstatsUtils.get_price_data(symbol, data_dir, online)
+            except Exception as e:
+                print(f"Error loading price data for {symbol}: {e}")
+
+        return compute_indicator_panel(prices, indicators, start_date, end_date)
+
     @staticmethod
     def get_stock_stats(
         symbol: Annotated[str, "ticker symbol for the company"],
@@ -25,63 +207,14 @@ class StockstatsUtils:
             "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
         ] = False,
     ):
-        df = None
-        data = None
+        curr_date = pd.to_datetime(curr_date).strftime("%Y-%m-%d")
 
-        if not online:
-            try:
-                data = pd.read_csv(
-                    os.path.join(
-                        data_dir,
-                        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
-                )
-                df = wrap(data)
-            except FileNotFoundError:
-                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
-        else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = pd.Timestamp.today()
-            curr_date = pd.to_datetime(curr_date)
-
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
-
-            # Get config and ensure cache directory exists
-            config = get_config()
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
-            )
-
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
-
-            df = wrap(data)
-            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-            curr_date = curr_date.strftime("%Y-%m-%d")
-
-        df[indicator]  # trigger stockstats to calculate the indicator
-        matching_rows = df[df["Date"].str.startswith(curr_date)]
+        values = StockstatsUtils.get_stock_stats_range(
+            symbol, indicator, curr_date, curr_date, data_dir, online
+        )
 
-        if not matching_rows.empty:
-            indicator_value = matching_rows[indicator].values[0]
+        if not values.empty:
+            indicator_value = values.iloc[0]
             return indicator_value
         else:
             return "N/A: Not a trading day (weekend or holiday)"
@@ -0,0 +1,78 @@
+from typing import Annotated, Iterable, Optional
+
+import numpy as np
+
+
+def calendar_days(
+    start_date: Annotated[str, "first day, YYYY-mm-dd"],
+    end_date: Annotated[str, "last day, YYYY-mm-dd"],
+) -> np.ndarray:
+    """Every calendar day in [start_date, end_date] as YYYY-mm-dd strings."""
+    return np.arange(
+        np.datetime64(start_date, "D"), np.datetime64(end_date, "D") + 1
+    ).astype("U10")
+
+
+class TradingCalendar:
+    """
+    Sorted trading sessions of a price history. Range and membership queries
+    are answered by binary search instead of stepping through the dates.
+    """
+
+    def __init__(
+        self,
+        sessions: Annotated[Iterable[str], "trading dates, YYYY-mm-dd"],
+        assume_sorted: Annotated[
+            bool, "skip sorting and de-duplicating, e.g. for price data dates"
+        ] = False,
+    ):
+        sessions = np.asarray(sessions, dtype="U10")
+        if not assume_sorted:
+            sessions = np.unique(sessions)
+        self.sessions = sessions
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def __contains__(self, date: str) -> bool:
+        i = np.searchsorted(self.sessions, date, "left")
+        return i < len(self.sessions) and self.sessions[i] == date
+
+    def index_range(
+        self,
+        start_date: Annotated[Optional[str], "first date, YYYY-mm-dd, None for open"],
+        end_date: Annotated[Optional[str], "last date, YYYY-mm-dd, None for open"],
+    ) -> slice:
+        """Positions of the sessions in [start_date, end_date]."""
+        lo = 0 if start_date is None else np.searchsorted(self.sessions, start_date, "left")
+        hi = (
+            len(self.sessions)
+            if end_date is None
+            else np.searchsorted(self.sessions, end_date, "right")
+        )
+        return slice(int(lo), int(hi))
+
+    def sessions_in_range(
+        self,
+        start_date: Annotated[Optional[str], "first date, YYYY-mm-dd"],
+        end_date: Annotated[Optional[str], "last date, YYYY-mm-dd"],
+    ) -> np.ndarray:
+        """Trading days in [start_date, end_date]."""
+        return self.sessions[self.index_range(start_date, end_date)]
+
+    def is_session(
+        self, dates: Annotated[np.ndarray, "YYYY-mm-dd strings"]
+    ) -> np.ndarray:
+        """Boolean mask of which dates are trading days."""
+        dates = np.asarray(dates, dtype="U10")
+        if len(self.sessions) == 0:
+            return np.zeros(dates.shape, dtype=bool)
+        i = np.minimum(np.searchsorted(self.sessions, dates, "left"), len(self.sessions) - 1)
+        return self.sessions[i] == dates
+
+    def previous_session(
+        self, date: Annotated[str, "YYYY-mm-dd"]
+    ) -> Optional[str]:
+        """The last trading day on or before date, None if there is none."""
+        i = np.searchsorted(self.sessions, date, "right")
+        return str(self.sessions[i - 1]) if i > 0 else None
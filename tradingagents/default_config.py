@@ -8,15 +8,40 @@ DEFAULT_CONFIG = {
         os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
         "dataflows/data_cache",
     ),
+    # On-disk format for downloaded price data: feather, parquet or csv
+    "price_cache_format": "feather",
+    # Indicator computation: stockstats or numpy (in-repo vectorized kernels)
+    "indicator_backend": "stockstats",
+    # Memory budget for parsed price histories shared across tools
+    "price_store_max_mb": 512,
+    # Google News scraping: pages fetched at once and request rate limit
+    "google_news_max_concurrency": 3,
+    "google_news_requests_per_second": 1.0,
+    # Result page parser for Google News: lxml (compiled selectors) or bs4
+    "google_news_parser": "lxml",
+    # Cached news for windows reaching today expire after this many hours
+    "google_news_cache_ttl_hours": 6,
+    # Cached OpenAI web-search answers for today or later expire after this many hours
+    "openai_cache_ttl_hours": 6,
+    # Connection pool and timeouts (seconds) of the shared OpenAI clients
+    "openai_max_connections": 64,
+    "openai_max_keepalive_connections": 32,
+    "openai_keepalive_expiry": 60.0,
+    "openai_timeout": 120.0,
+    "openai_connect_timeout": 10.0,
     # LLM settings
     "llm_provider": "openai",
     "deep_think_llm": "o4-mini",
     "quick_think_llm": "gpt-4o-mini",
     "backend_url": "https://api.openai.com/v1",
+    # Analyst execution: sequential (one after another) or parallel (fan-out from START)
+    "analyst_topology": "sequential",
     # Debate and discussion settings
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Runs of propagate_many in flight at once
+    "max_concurrent_propagations": 8,
     # Tool settings
     "online_tools": True,
 }
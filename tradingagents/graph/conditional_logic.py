@@ -13,35 +13,35 @@ class ConditionalLogic:
 
     def should_continue_market(self, state: AgentState):
         """Determine if market analysis should continue."""
-        messages = state["messages"]
+        messages = state["market_messages"]
         last_message = messages[-1]
         if last_message.tool_calls:
             return "tools_market"
-        return "Msg Clear Market"
+        return "done"
 
     def should_continue_social(self, state: AgentState):
         """Determine if social media analysis should continue."""
-        messages = state["messages"]
+        messages = state["social_messages"]
         last_message = messages[-1]
         if last_message.tool_calls:
             return "tools_social"
-        return "Msg Clear Social"
+        return "done"
 
     def should_continue_news(self, state: AgentState):
         """Determine if news analysis should continue."""
-        messages = state["messages"]
+        messages = state["news_messages"]
         last_message = messages[-1]
         if last_message.tool_calls:
             return "tools_news"
-        return "Msg Clear News"
+        return "done"
 
     def should_continue_fundamentals(self, state: AgentState):
         """Determine if fundamentals analysis should continue."""
-        messages = state["messages"]
+        messages = state["fundamentals_messages"]
         last_message = messages[-1]
         if last_message.tool_calls:
             return "tools_fundamentals"
-        return "Msg Clear Fundamentals"
+        return "done"
 
     def should_continue_debate(self, state: AgentState) -> str:
         """Determine if debate should continue."""
@@ -1,7 +1,9 @@
 # TradingAgents/graph/propagation.py
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from langchain_core.messages import AnyMessage
 from tradingagents.agents.utils.agent_states import (
+    ANALYST_MESSAGE_CHANNELS,
     AgentState,
     InvestDebateState,
     RiskDebateState,
@@ -21,6 +23,11 @@ class Propagator:
         """Create the initial state for the agent graph."""
         return {
             "messages": [("human", company_name)],
+            # every analyst starts its own conversation from the ticker
+            **{
+                channel: [("human", company_name)]
+                for channel in ANALYST_MESSAGE_CHANNELS.values()
+            },
             "company_of_interest": company_name,
             "trade_date": str(trade_date),
             "investment_debate_state": InvestDebateState(
@@ -41,6 +48,16 @@ class Propagator:
             "news_report": "",
         }
 
+    def get_new_messages(
+        self, previous_state: Optional[Dict[str, Any]], state: Dict[str, Any]
+    ) -> List[AnyMessage]:
+        """Get the analyst messages added between two streamed state values."""
+        new_messages = []
+        for channel in ANALYST_MESSAGE_CHANNELS.values():
+            seen = len(previous_state[channel]) if previous_state else 0
+            new_messages.extend(state[channel][seen:])
+        return new_messages
+
     def get_graph_args(self) -> Dict[str, Any]:
         """Get arguments for the graph invocation."""
         return {
@@ -1,10 +1,21 @@
 # TradingAgents/graph/trading_graph.py
 
+import asyncio
 import os
 from pathlib import Path
 import json
 from datetime import date
-from typing import Dict, Any, Tuple, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
@@ -16,11 +27,13 @@ from tradingagents.agents import *
 from tradingagents.default_config import DEFAULT_CONFIG
 from tradingagents.agents.utils.memory import FinancialSituationMemory
 from tradingagents.agents.utils.agent_states import (
+    ANALYST_MESSAGE_CHANNELS,
     AgentState,
     InvestDebateState,
     RiskDebateState,
 )
 from tradingagents.dataflows.interface import set_config
+from tradingagents.dataflows.openai_clients import aclose_async_openai_clients
 
 from .conditional_logic import ConditionalLogic
 from .setup import GraphSetup
@@ -29,6 +42,16 @@ from .reflection import Reflector
 from .signal_processing import SignalProcessor
 
 
+class PropagationResult(NamedTuple):
+    """Outcome of one (company, date) run of a batch propagation."""
+
+    company_name: str
+    trade_date: str
+    final_state: Optional[Dict[str, Any]]
+    decision: Optional[str]
+    error: Optional[Exception]
+
+
 class TradingAgentsGraph:
     """Main class that orchestrates the trading agents framework."""
 
@@ -104,10 +127,15 @@ class TradingAgentsGraph:
         # State tracking
         self.curr_state = None
         self.ticker = None
-        self.log_states_dict = {}  # date to full state dict
+        self.log_states_dict = {}  # ticker to {date: full state dict}
+        # reused by every propagate_many call, so the async clients' pooled
+        # connections never outlive their loop
+        self._event_loop = None
 
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts, self.config["analyst_topology"]
+        )
 
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
         """Create tool nodes for different data sources."""
@@ -120,7 +148,8 @@ class TradingAgentsGraph:
                     # offline tools
                     self.toolkit.get_YFin_data,
                     self.toolkit.get_stockstats_indicators_report,
-                ]
+                ],
+                messages_key=ANALYST_MESSAGE_CHANNELS["market"],
             ),
             "social": ToolNode(
                 [
@@ -128,7 +157,8 @@ class TradingAgentsGraph:
                     self.toolkit.get_stock_news_openai,
                     # offline tools
                     self.toolkit.get_reddit_stock_info,
-                ]
+                ],
+                messages_key=ANALYST_MESSAGE_CHANNELS["social"],
             ),
             "news": ToolNode(
                 [
@@ -138,7 +168,8 @@ class TradingAgentsGraph:
                     # offline tools
                     self.toolkit.get_finnhub_news,
                     self.toolkit.get_reddit_news,
-                ]
+                ],
+                messages_key=ANALYST_MESSAGE_CHANNELS["news"],
             ),
             "fundamentals": ToolNode(
                 [
@@ -150,7 +181,8 @@ class TradingAgentsGraph:
                     self.toolkit.get_simfin_balance_sheet,
                     self.toolkit.get_simfin_cashflow,
                     self.toolkit.get_simfin_income_stmt,
-                ]
+                ],
+                messages_key=ANALYST_MESSAGE_CHANNELS["fundamentals"],
             ),
         }
 
@@ -169,11 +201,7 @@ class TradingAgentsGraph:
             # Debug mode with tracing
             trace = []
             for chunk in self.graph.stream(init_agent_state, **args):
-                if len(chunk["messages"]) == 0:
-                    pass
-                else:
-                    chunk["messages"][-1].pretty_print()
-                    trace.append(chunk)
+                self._trace(trace, chunk)
 
             final_state = trace[-1]
         else:
@@ -189,9 +217,134 @@ class TradingAgentsGraph:
         # Return decision and processed signal
         return final_state, self.process_signal(final_state["final_trade_decision"])
 
+    async def apropagate(self, company_name, trade_date):
+        """Async version of propagate.
+
+        Every node awaits its LLM calls and the web tools run on the event
+        loop, so one loop can drive many analyses concurrently. Like
+        propagate, it keeps the run as the one reflect_and_remember reflects
+        on; concurrent runs should use apropagate_many instead.
+        """
+
+        self.ticker = company_name
+        final_state, decision = await self._arun(company_name, trade_date)
+
+        # Store current state for reflection
+        self.curr_state = final_state
+
+        return final_state, decision
+
+    async def _arun(self, company_name, trade_date):
+        """One async run of the graph, without touching the graph's current run."""
+
+        # Initialize state
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
+        )
+        args = self.propagator.get_graph_args()
+
+        if self.debug:
+            # Debug mode with tracing
+            trace = []
+            async for chunk in self.graph.astream(init_agent_state, **args):
+                self._trace(trace, chunk)
+
+            final_state = trace[-1]
+        else:
+            # Standard mode without tracing
+            final_state = await self.graph.ainvoke(init_agent_state, **args)
+
+        # Log state
+        self._log_state(trade_date, final_state)
+
+        # Return decision and processed signal
+        return final_state, await self.aprocess_signal(
+            final_state["final_trade_decision"]
+        )
+
+    async def apropagate_many(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[PropagationResult]:
+        """Run apropagate for many (company, date) pairs at once.
+
+        At most max_concurrency runs are in flight; they share this graph's
+        LLM clients, memories and tool caches. Results are yielded as runs
+        complete, and a failing run is reported in its result's error
+        instead of stopping the batch. Batch runs leave ticker and curr_state
+        alone; to reflect on one, pass its final_state to reflect_and_remember.
+        """
+        if max_concurrency is None:
+            max_concurrency = self.config["max_concurrent_propagations"]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(company_name, trade_date):
+            async with semaphore:
+                try:
+                    final_state, decision = await self._arun(
+                        company_name, trade_date
+                    )
+                except Exception as e:
+                    return PropagationResult(company_name, trade_date, None, None, e)
+            return PropagationResult(
+                company_name, trade_date, final_state, decision, None
+            )
+
+        tasks = [
+            asyncio.ensure_future(run(company_name, trade_date))
+            for company_name, trade_date in pairs
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            # the caller stopped early; don't leave runs behind
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def propagate_many(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        max_concurrency: Optional[int] = None,
+    ) -> Iterator[PropagationResult]:
+        """Run the graph for many (company, date) pairs with bounded concurrency.
+
+        Blocking version of apropagate_many, for use outside an event loop.
+        Results are yielded in completion order, not input order. The runs
+        share one event loop kept until close() is called.
+        """
+        if self._event_loop is None:
+            self._event_loop = asyncio.new_event_loop()
+        loop = self._event_loop
+
+        results = self.apropagate_many(pairs, max_concurrency)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(results.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            loop.run_until_complete(results.aclose())
+
+    def _trace(self, trace, chunk):
+        """Print the messages a streamed chunk added and append it to the debug trace."""
+        new_messages = self.propagator.get_new_messages(
+            trace[-1] if trace else None, chunk
+        )
+        for message in new_messages:
+            message.pretty_print()
+        trace.append(chunk)
+
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        # taken from the state rather than self.ticker, which concurrent
+        # runs overwrite
+        ticker = final_state["company_of_interest"]
+        log_states = self.log_states_dict.setdefault(ticker, {})
+        log_states[str(trade_date)] = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -222,33 +375,52 @@ class TradingAgentsGraph:
         }
 
         # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
+        directory = Path(f"eval_results/{ticker}/TradingAgentsStrategy_logs/")
         directory.mkdir(parents=True, exist_ok=True)
 
         with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log.json",
+            f"eval_results/{ticker}/TradingAgentsStrategy_logs/full_states_log.json",
             "w",
         ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+            json.dump(log_states, f, indent=4)
+
+    def reflect_and_remember(self, returns_losses, final_state=None):
+        """Reflect on decisions and update memory based on returns.
 
-    def reflect_and_remember(self, returns_losses):
-        """Reflect on decisions and update memory based on returns."""
+        Reflects on final_state, e.g. one of a propagate_many result, and
+        defaults to the state of the last propagate or apropagate call.
+        """
+        if final_state is None:
+            final_state = self.curr_state
         self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
+            final_state, returns_losses, self.bull_memory
         )
         self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
-        )
-        self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
+            final_state, returns_losses, self.bear_memory
         )
+        self.reflector.reflect_trader(final_state, returns_losses, self.trader_memory)
         self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
+            final_state, returns_losses, self.invest_judge_memory
         )
         self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
+            final_state, returns_losses, self.risk_manager_memory
         )
 
+    def close(self):
+        """Close the event loop of propagate_many and the OpenAI clients bound to it."""
+        if self._event_loop is None:
+            return
+        loop, self._event_loop = self._event_loop, None
+        try:
+            loop.run_until_complete(aclose_async_openai_clients())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
     def process_signal(self, full_signal):
         """Process a signal to extract the core decision."""
         return self.signal_processor.process_signal(full_signal)
+
+    async def aprocess_signal(self, full_signal):
+        """Async version of process_signal."""
+        return await self.signal_processor.aprocess_signal(full_signal)